@@ -1,71 +1,125 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form, BackgroundTasks, Header, Path, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+import asyncio
+import orjson
 import structlog
-import json
 
+
+from ...config import settings
 from ...services import R2RService
+from ..utils import weak_etag
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# In-process extraction status keyed by document_id (pending, done,
+# failed). Bounded LRU: the oldest entries are evicted past the cap so
+# the map cannot grow for the life of the worker.
+_MAX_TRACKED_EXTRACTIONS = 1024
+_extraction_status: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _track_extraction(document_id: str, status: Dict[str, Any]):
+    _extraction_status[document_id] = status
+    _extraction_status.move_to_end(document_id)
+    while len(_extraction_status) > _MAX_TRACKED_EXTRACTIONS:
+        _extraction_status.popitem(last=False)
+
+DocumentId = Path(..., pattern=r"^[A-Za-z0-9_-]{1,64}$")
+
+
+async def get_r2r_service(request: Request) -> R2RService:
+    """Return the shared R2R service created at startup."""
+    service = getattr(request.app.state, "r2r_service", None)
+    if service is None:
+        raise HTTPException(status_code=503, detail="R2R service unavailable")
+    return service
 
-async def get_r2r_service():
-    async with R2RService() as service:
-        yield service
+
+async def _extract_entities_task(document_id: str, r2r_service: R2RService):
+    """Run entity extraction after the upload response has been sent."""
+    _track_extraction(document_id, {"status": "pending"})
+
+    try:
+        entities = await r2r_service.extract_entities(document_id)
+
+        _track_extraction(document_id, {
+            "status": "done",
+            "entity_count": len(entities)
+        })
+    except Exception as e:
+        logger.error(
+            "Background entity extraction failed",
+            error=str(e),
+            document_id=document_id
+        )
+        _track_extraction(document_id, {"status": "failed", "error": str(e)})
 
 
 @router.post("/upload")
 async def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     metadata: Optional[str] = Form(None),
     extract_entities: bool = Form(True),
+    wait: bool = False,
     r2r_service: R2RService = Depends(get_r2r_service)
 ):
     """
     Upload and process a document.
 
+    Entity extraction runs in the background by default; poll
+    GET /documents/{id}/entities for results. Pass wait=true to
+    block until extraction completes.
+
     Args:
         file: Document file to upload
         metadata: Optional JSON metadata
         extract_entities: Whether to extract entities
+        wait: Wait for entity extraction before responding
 
     Returns:
         Document processing result
     """
     try:
-        doc_metadata = json.loads(metadata) if metadata else {}
-
-        import tempfile
-        import os
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
+        doc_metadata = orjson.loads(metadata) if metadata else {}
+
+        await file.seek(0)
+        ingest_result = await r2r_service.ingest_document_stream(
+            file.file,
+            file.filename,
+            content_type=file.content_type,
+            metadata=doc_metadata
+        )
+        document_id = ingest_result["document_id"]
 
-        try:
-            document_id = await r2r_service.ingest_document(
-                file_path=tmp_file_path,
-                metadata=doc_metadata
+        if extract_entities and not wait:
+            background_tasks.add_task(
+                _extract_entities_task, document_id, r2r_service
             )
 
-            entities = []
-            if extract_entities:
-                entities = await r2r_service.extract_entities(document_id)
-
             return {
-                "status": "success",
+                "status": "processing_entities",
                 "document_id": document_id,
                 "filename": file.filename,
-                "size": len(content),
-                "entities_extracted": len(entities),
-                "entities": entities[:10]  # Return first 10 entities
+                "size": file.size
             }
 
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_file_path)
+        entities = []
+        if extract_entities:
+            entities = await r2r_service.extract_entities(document_id)
+
+        return {
+            "status": "success",
+            "document_id": document_id,
+            "filename": file.filename,
+            "size": file.size,
+            "entities_extracted": len(entities),
+            "entities": entities[:10]  # Return first 10 entities
+        }
 
     except Exception as e:
         logger.error("Document upload failed", error=str(e))
@@ -74,13 +128,18 @@ async def upload_document(
 
 @router.get("/{document_id}")
 async def get_document(
-    document_id: str,
+    response: Response,
+    document_id: str = DocumentId,
     include_chunks: bool = False,
+    if_none_match: Optional[str] = Header(None),
     r2r_service: R2RService = Depends(get_r2r_service)
 ):
     """
     Get document details.
 
+    Supports conditional requests: a matching If-None-Match header
+    short-circuits with 304 Not Modified.
+
     Args:
         document_id: R2R document ID
         include_chunks: Whether to include document chunks
@@ -91,17 +150,24 @@ async def get_document(
     try:
         metadata = await r2r_service.get_document_metadata(document_id)
 
-        response = {
+        etag = weak_etag(document_id, str(metadata.get("updated_at", "")))
+        if if_none_match == etag:
+            return Response(status_code=304)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=30"
+
+        body = {
             "document_id": document_id,
             "metadata": metadata
         }
 
         if include_chunks:
             chunks = await r2r_service.get_document_chunks(document_id)
-            response["chunks"] = chunks
-            response["chunk_count"] = len(chunks)
+            body["chunks"] = chunks
+            body["chunk_count"] = len(chunks)
 
-        return response
+        return body
 
     except Exception as e:
         logger.error("Failed to get document", error=str(e), document_id=document_id)
@@ -110,7 +176,7 @@ async def get_document(
 
 @router.delete("/{document_id}")
 async def delete_document(
-    document_id: str,
+    document_id: str = DocumentId,
     r2r_service: R2RService = Depends(get_r2r_service)
 ):
     """
@@ -138,6 +204,23 @@ async def delete_document(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _process_one(file: UploadFile, r2r_service: R2RService) -> Dict[str, Any]:
+    """Ingest a single uploaded file and build its batch result entry."""
+    await file.seek(0)
+    ingest_result = await r2r_service.ingest_document_stream(
+        file.file,
+        file.filename,
+        content_type=file.content_type,
+        metadata={"filename": file.filename}
+    )
+
+    return {
+        "filename": file.filename,
+        "status": "success",
+        "document_id": ingest_result["document_id"]
+    }
+
+
 @router.post("/batch/upload")
 async def batch_upload(
     files: List[UploadFile] = File(...),
@@ -146,61 +229,50 @@ async def batch_upload(
     """
     Upload multiple documents.
 
+    Streams one NDJSON line per completed file as ingestions finish,
+    followed by a summary line.
+
     Args:
         files: List of document files
 
     Returns:
-        Batch upload results
+        NDJSON stream of per-file results
     """
-    results = []
-
-    for file in files:
-        try:
-            # Save uploaded file temporarily
-            import tempfile
-            import os
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as tmp_file:
-                content = await file.read()
-                tmp_file.write(content)
-                tmp_file_path = tmp_file.name
+    semaphore = asyncio.Semaphore(settings.batch_upload_concurrency)
 
+    async def guarded(file: UploadFile) -> Dict[str, Any]:
+        async with semaphore:
             try:
-                # Ingest document
-                document_id = await r2r_service.ingest_document(
-                    file_path=tmp_file_path,
-                    metadata={"filename": file.filename}
-                )
-
-                results.append({
+                return await _process_one(file, r2r_service)
+            except Exception as e:
+                return {
                     "filename": file.filename,
-                    "status": "success",
-                    "document_id": document_id
-                })
+                    "status": "failed",
+                    "error": str(e)
+                }
 
-            finally:
-                os.unlink(tmp_file_path)
+    async def generate():
+        successful = 0
+        tasks = [asyncio.ensure_future(guarded(file)) for file in files]
 
-        except Exception as e:
-            results.append({
-                "filename": file.filename,
-                "status": "failed",
-                "error": str(e)
-            })
+        for completed in asyncio.as_completed(tasks):
+            result = await completed
+            if result["status"] == "success":
+                successful += 1
+            yield orjson.dumps(result) + b"\n"
 
-    successful = sum(1 for r in results if r["status"] == "success")
+        yield orjson.dumps({
+            "total": len(files),
+            "successful": successful,
+            "failed": len(files) - successful
+        }) + b"\n"
 
-    return {
-        "total": len(files),
-        "successful": successful,
-        "failed": len(files) - successful,
-        "results": results
-    }
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{document_id}/entities")
 async def get_document_entities(
-    document_id: str,
+    document_id: str = DocumentId,
     entity_types: Optional[List[str]] = None,
     r2r_service: R2RService = Depends(get_r2r_service)
 ):
@@ -214,6 +286,16 @@ async def get_document_entities(
     Returns:
         List of extracted entities
     """
+    tracked = _extraction_status.get(document_id)
+    if tracked and tracked["status"] != "done":
+        return {
+            "document_id": document_id,
+            "extraction_status": tracked["status"],
+            "entity_count": 0,
+            "entities": [],
+            **({"error": tracked["error"]} if "error" in tracked else {})
+        }
+
     try:
         entities = await r2r_service.extract_entities(
             document_id,
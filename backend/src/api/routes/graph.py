@@ -1,10 +1,16 @@
 """Graph management API routes."""
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Optional, Dict, Any, List
+from fastapi import APIRouter, HTTPException, Depends, Header, Path, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Optional, Dict, Any, List, Literal
+import orjson
+import re
 import structlog
+from pydantic import BaseModel, ConfigDict
 
+from ...config import settings
 from ...services import Neo4jService, VectorService
+from ..utils import weak_etag
 from ...models.entities import Entity, EntityFilter, Person, Event, Location
 from ...models.relationships import (
     Relationship,
@@ -17,22 +23,67 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/graph", tags=["graph"])
 
+_IS_PROD: bool = settings.environment == "production"
 
-async def get_neo4j_service():
-    async with Neo4jService() as service:
-        yield service
+_FORBIDDEN_CYPHER = re.compile(r"\b(?:DROP|DELETE|REMOVE|DETACH)\b", re.IGNORECASE)
+_CYPHER_NOISE = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|//[^\n]*|/\*.*?\*/",
+    re.DOTALL
+)
+
+
+def _strip_strings_and_comments(query: str) -> str:
+    """Remove string literals and comments so they can't trip the keyword guard."""
+    return _CYPHER_NOISE.sub(" ", query)
+
+
+EntityId = Path(..., pattern=r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class SimilarEntitySearchRequest(BaseModel):
+    """Request body for /graph/search/similar."""
+    model_config = ConfigDict(extra="forbid")
+
+    query_embedding: List[float]
+    limit: int = 10
+    entity_types: Optional[List[str]] = None
+    threshold: float = 0.7
+
+
+class CypherRequest(BaseModel):
+    """Request body for /graph/cypher."""
+    model_config = ConfigDict(extra="forbid")
+
+    query: str
+    parameters: Optional[Dict[str, Any]] = None
+
+
+async def get_neo4j_service(request: Request) -> Neo4jService:
+    """Return the shared Neo4j service created at startup."""
+    service = getattr(request.app.state, "neo4j_service", None)
+    if service is None:
+        raise HTTPException(status_code=503, detail="Graph database unavailable")
+    return service
 
 
-async def get_vector_service():
-    async with VectorService() as service:
-        yield service
+async def get_vector_service(request: Request) -> VectorService:
+    """Return the shared vector service created at startup."""
+    service = getattr(request.app.state, "vector_service", None)
+    if service is None:
+        raise HTTPException(status_code=503, detail="Vector service unavailable")
+    return service
+
+
+async def get_embedding_coalescer(request: Request):
+    return getattr(request.app.state, "embedding_coalescer", None)
 
 
 @router.post("/entities")
 async def create_entity(
     entity: Entity,
     neo4j_service: Neo4jService = Depends(get_neo4j_service),
-    vector_service: VectorService = Depends(get_vector_service)
+    vector_service: VectorService = Depends(get_vector_service),
+    embedding_coalescer=Depends(get_embedding_coalescer)
 ):
     """
     Create a new entity in the graph.
@@ -47,12 +98,22 @@ async def create_entity(
         entity_id = await neo4j_service.create_entity(entity)
 
         if entity.embedding:
-            await vector_service.store_embedding(
-                entity_id=entity_id,
-                entity_type=entity.type.value,
-                embedding=entity.embedding,
-                metadata={"name": entity.name, "confidence": entity.confidence_score}
-            )
+            if embedding_coalescer:
+                # Batched, eventually-consistent write; the Neo4j node
+                # above remains the synchronous source of truth.
+                await embedding_coalescer.submit((
+                    entity_id,
+                    entity.type.value,
+                    entity.embedding,
+                    {"name": entity.name, "confidence": entity.confidence_score}
+                ))
+            else:
+                await vector_service.store_embedding(
+                    entity_id=entity_id,
+                    entity_type=entity.type.value,
+                    embedding=entity.embedding,
+                    metadata={"name": entity.name, "confidence": entity.confidence_score}
+                )
 
         return {
             "status": "success",
@@ -67,13 +128,18 @@ async def create_entity(
 
 @router.get("/entities/{entity_id}")
 async def get_entity(
-    entity_id: str,
+    response: Response,
+    entity_id: str = EntityId,
     include_relationships: bool = False,
+    if_none_match: Optional[str] = Header(None),
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Get entity details.
 
+    Supports conditional requests: a matching If-None-Match header
+    short-circuits with 304 Not Modified.
+
     Args:
         entity_id: Entity ID
         include_relationships: Whether to include relationships
@@ -87,13 +153,20 @@ async def get_entity(
         if not entity:
             raise HTTPException(status_code=404, detail="Entity not found")
 
-        response = {"entity": entity}
+        etag = weak_etag(entity_id, str(entity.get("updated_at", "")))
+        if if_none_match == etag:
+            return Response(status_code=304)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, max-age=30"
+
+        body = {"entity": entity}
 
         if include_relationships:
             relationships = await neo4j_service.get_entity_relationships(entity_id)
-            response["relationships"] = relationships
+            body["relationships"] = relationships
 
-        return response
+        return body
 
     except HTTPException:
         raise
@@ -104,8 +177,8 @@ async def get_entity(
 
 @router.put("/entities/{entity_id}")
 async def update_entity(
-    entity_id: str,
     updates: Dict[str, Any],
+    entity_id: str = EntityId,
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
@@ -138,7 +211,7 @@ async def update_entity(
 
 @router.delete("/entities/{entity_id}")
 async def delete_entity(
-    entity_id: str,
+    entity_id: str = EntityId,
     neo4j_service: Neo4jService = Depends(get_neo4j_service),
     vector_service: VectorService = Depends(get_vector_service)
 ):
@@ -202,20 +275,26 @@ async def create_relationship(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/search/entities")
+@router.post("/search/entities", response_class=ORJSONResponse)
 async def search_entities(
     filter: Optional[EntityFilter] = None,
     limit: int = 50,
     offset: int = 0,
+    after: Optional[str] = None,
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Search for entities with filters.
 
+    Pagination: pass the returned `next_cursor` as `after` to fetch the
+    next page in constant time; `offset` stays supported but re-scans
+    skipped rows on deep pages.
+
     Args:
         filter: Entity filter criteria
         limit: Maximum results
-        offset: Result offset
+        offset: Result offset (legacy)
+        after: Keyset cursor from a previous response's next_cursor
 
     Returns:
         List of matching entities
@@ -224,13 +303,20 @@ async def search_entities(
         entities = await neo4j_service.find_entities(
             filter=filter,
             limit=limit,
-            offset=offset
+            offset=offset,
+            after=after
+        )
+
+        next_cursor = (
+            entities[-1].get("created_at")
+            if entities and len(entities) == limit else None
         )
 
         return {
             "count": len(entities),
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "entities": entities
         }
 
@@ -239,12 +325,9 @@ async def search_entities(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/search/similar")
+@router.post("/search/similar", response_class=ORJSONResponse)
 async def search_similar_entities(
-    query_embedding: List[float],
-    limit: int = 10,
-    entity_types: Optional[List[str]] = None,
-    threshold: float = 0.7,
+    request: SimilarEntitySearchRequest,
     vector_service: VectorService = Depends(get_vector_service),
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
@@ -252,10 +335,7 @@ async def search_similar_entities(
     Find similar entities based on embeddings.
 
     Args:
-        query_embedding: Query embedding vector
-        limit: Maximum results
-        entity_types: Filter by entity types
-        threshold: Similarity threshold
+        request: Similarity search parameters
 
     Returns:
         List of similar entities
@@ -263,25 +343,26 @@ async def search_similar_entities(
     try:
         # Search for similar embeddings
         similar = await vector_service.similarity_search(
-            query_embedding=query_embedding,
-            limit=limit,
-            entity_types=entity_types,
-            threshold=threshold
+            query_embedding=request.query_embedding,
+            limit=request.limit,
+            entity_types=request.entity_types,
+            threshold=request.threshold
         )
 
-        # Enrich with entity data
-        enriched = []
-        for item in similar:
-            entity = await neo4j_service.get_entity(item["entity_id"])
-            if entity:
-                enriched.append({
-                    **item,
-                    "entity": entity
-                })
+        # Enrich with entity data in a single query
+        entities = await neo4j_service.get_entities_by_ids(
+            [item["entity_id"] for item in similar]
+        )
+
+        enriched = [
+            {**item, "entity": entities[item["entity_id"]]}
+            for item in similar
+            if item["entity_id"] in entities
+        ]
 
         return {
             "count": len(enriched),
-            "threshold": threshold,
+            "threshold": request.threshold,
             "results": enriched
         }
 
@@ -290,7 +371,7 @@ async def search_similar_entities(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/traverse")
+@router.post("/traverse", response_class=ORJSONResponse)
 async def traverse_graph(
     request: GraphTraversalRequest,
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
@@ -321,8 +402,8 @@ async def traverse_graph(
 
 @router.get("/entities/{entity_id}/relationships")
 async def get_entity_relationships(
-    entity_id: str,
-    direction: str = "both",
+    entity_id: str = EntityId,
+    direction: Literal["in", "out", "both"] = "both",
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
@@ -336,12 +417,6 @@ async def get_entity_relationships(
         List of relationships
     """
     try:
-        if direction not in ["in", "out", "both"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Direction must be 'in', 'out', or 'both'"
-            )
-
         relationships = await neo4j_service.get_entity_relationships(
             entity_id,
             direction=direction
@@ -365,9 +440,10 @@ async def get_entity_relationships(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/visualize")
+@router.post("/visualize", response_class=ORJSONResponse)
 async def get_graph_visualization(
     config: GraphVisualization,
+    stream: bool = False,
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
@@ -375,52 +451,59 @@ async def get_graph_visualization(
 
     Args:
         config: Visualization configuration
+        stream: Stream nodes then edges as NDJSON lines instead of one
+            JSON document, so large graphs can render progressively
 
     Returns:
         Graph data formatted for visualization
     """
     try:
-        entities = await neo4j_service.find_entities(
+        options = {
+            "show_labels": config.show_labels,
+            "show_properties": config.show_properties
+        }
+
+        nodes = await neo4j_service.find_visualization_nodes(
             filter=config.entity_filter,
-            limit=config.max_nodes
+            limit=config.max_nodes,
+            show_properties=config.show_properties
         )
 
-        entity_ids = [e["id"] for e in entities]
-        relationships = []
-
-        for entity_id in entity_ids[:config.max_nodes]:
-            rels = await neo4j_service.get_entity_relationships(entity_id)
-            relationships.extend(rels[:config.max_edges // len(entity_ids)])
-
-        nodes = [
-            {
-                "id": e["id"],
-                "label": e.get("name", e["id"]),
-                "type": e.get("type", "unknown"),
-                "properties": e if config.show_properties else {}
+        if not nodes:
+            return {
+                "nodes": [],
+                "edges": [],
+                "layout": config.layout,
+                "options": options
             }
-            for e in entities
-        ]
 
-        edges = [
-            {
-                "source": r.get("source", {}).get("id"),
-                "target": r.get("target", {}).get("id"),
-                "type": r.get("type"),
-                "weight": r.get("weight", 1.0)
-            }
-            for r in relationships
-            if r.get("source") and r.get("target")
-        ]
+        edges = await neo4j_service.get_subgraph_edges(
+            [node["id"] for node in nodes],
+            max_edges=config.max_edges
+        )
+
+        if stream:
+            async def generate():
+                for node in nodes:
+                    yield orjson.dumps({"type": "node", **node}) + b"\n"
+                for edge in edges:
+                    yield orjson.dumps({"type": "edge", **edge}) + b"\n"
+                yield orjson.dumps({
+                    "type": "meta",
+                    "layout": config.layout,
+                    "options": options
+                }) + b"\n"
+
+            return StreamingResponse(
+                generate(),
+                media_type="application/x-ndjson"
+            )
 
         return {
             "nodes": nodes,
             "edges": edges,
             "layout": config.layout,
-            "options": {
-                "show_labels": config.show_labels,
-                "show_properties": config.show_properties
-            }
+            "options": options
         }
 
     except Exception as e:
@@ -428,33 +511,33 @@ async def get_graph_visualization(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/cypher")
+@router.post("/cypher", response_class=ORJSONResponse)
 async def execute_cypher_query(
-    query: str,
-    parameters: Optional[Dict[str, Any]] = None,
+    request: CypherRequest,
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
 ):
     """
     Execute a raw Cypher query.
 
     Args:
-        query: Cypher query
-        parameters: Query parameters
+        request: Cypher query and parameters
 
     Returns:
         Query results
     """
     try:
-        forbidden_keywords = ["DROP", "DELETE", "REMOVE", "DETACH"]
-        if any(keyword in query.upper() for keyword in forbidden_keywords):
-            from ...config import settings
-            if settings.environment == "production":
-                raise HTTPException(
-                    status_code=403,
-                    detail="Destructive queries not allowed in production"
-                )
+        if _IS_PROD and _FORBIDDEN_CYPHER.search(
+            _strip_strings_and_comments(request.query)
+        ):
+            raise HTTPException(
+                status_code=403,
+                detail="Destructive queries not allowed in production"
+            )
 
-        results = await neo4j_service.execute_cypher(query, parameters)
+        results = await neo4j_service.execute_cypher(
+            request.query,
+            request.parameters
+        )
 
         return {
             "status": "success",
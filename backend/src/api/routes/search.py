@@ -1,33 +1,48 @@
-<<<<<<< HEAD
-# Search and retrieval API routes.
+"""Search and retrieval API routes."""
 
-=======
->>>>>>> 4123c1f (new forcegraph3d ui)
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 from typing import Optional, Dict, Any, List
+import asyncio
 import structlog
 
-from ...services import R2RService, Neo4jService, VectorService
-from ...models.entities import EntitySearchRequest
+from ...services import R2RService, Neo4jService, VectorService, cache_key
 
 logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/search", tags=["search"])
 
 
-async def get_r2r_service():
-    async with R2RService() as service:
-        yield service
+async def _noop():
+    """Placeholder awaitable for skipped branches in gather calls."""
+    return None
 
 
-async def get_neo4j_service():
-    async with Neo4jService() as service:
-        yield service
+async def get_r2r_service(request: Request) -> R2RService:
+    """Return the shared R2R service created at startup."""
+    service = getattr(request.app.state, "r2r_service", None)
+    if service is None:
+        raise HTTPException(status_code=503, detail="R2R service unavailable")
+    return service
 
 
-async def get_vector_service():
-    async with VectorService() as service:
-        yield service
+async def get_neo4j_service(request: Request) -> Neo4jService:
+    """Return the shared Neo4j service created at startup."""
+    service = getattr(request.app.state, "neo4j_service", None)
+    if service is None:
+        raise HTTPException(status_code=503, detail="Graph database unavailable")
+    return service
+
+
+async def get_vector_service(request: Request) -> VectorService:
+    """Return the shared vector service created at startup."""
+    service = getattr(request.app.state, "vector_service", None)
+    if service is None:
+        raise HTTPException(status_code=503, detail="Vector service unavailable")
+    return service
+
+
+async def get_semantic_cache(request: Request):
+    return getattr(request.app.state, "semantic_cache", None)
 
 
 @router.post("/documents")
@@ -36,7 +51,8 @@ async def search_documents(
     search_type: str = "hybrid",
     limit: int = 10,
     filters: Optional[Dict[str, Any]] = None,
-    r2r_service: R2RService = Depends(get_r2r_service)
+    r2r_service: R2RService = Depends(get_r2r_service),
+    semantic_cache=Depends(get_semantic_cache)
 ):
     """
     Search for documents using R2R.
@@ -51,6 +67,13 @@ async def search_documents(
         Search results from documents
     """
     try:
+        key = None
+        if semantic_cache:
+            key = cache_key(query, [search_type, limit, filters])
+            cached = await semantic_cache.get_by_text(key)
+            if cached is not None:
+                return cached
+
         results = await r2r_service.search(
             query=query,
             search_type=search_type,
@@ -58,13 +81,18 @@ async def search_documents(
             filters=filters
         )
 
-        return {
+        response = {
             "query": query,
             "search_type": search_type,
             "count": len(results),
             "results": results
         }
 
+        if key is not None:
+            await semantic_cache.set_by_text(key, response)
+
+        return response
+
     except Exception as e:
         logger.error("Document search failed", error=str(e), query=query)
         raise HTTPException(status_code=500, detail=str(e))
@@ -75,7 +103,8 @@ async def rag_search(
     messages: List[Dict[str, str]],
     search_query: Optional[str] = None,
     use_knowledge_graph: bool = True,
-    r2r_service: R2RService = Depends(get_r2r_service)
+    r2r_service: R2RService = Depends(get_r2r_service),
+    semantic_cache=Depends(get_semantic_cache)
 ):
     """
     Perform RAG search with context.
@@ -89,17 +118,32 @@ async def rag_search(
         RAG completion with context
     """
     try:
+        key = None
+        if semantic_cache:
+            key = cache_key(
+                search_query or "",
+                [messages, use_knowledge_graph]
+            )
+            cached = await semantic_cache.get_by_text(key)
+            if cached is not None:
+                return cached
+
         result = await r2r_service.rag_completion(
             messages=messages,
             search_query=search_query,
             use_knowledge_graph=use_knowledge_graph
         )
 
-        return {
+        response = {
             "status": "success",
             "response": result
         }
 
+        if key is not None:
+            await semantic_cache.set_by_text(key, response)
+
+        return response
+
     except Exception as e:
         logger.error("RAG search failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -134,48 +178,38 @@ async def hybrid_search(
             "sources": []
         }
 
-<<<<<<< HEAD
-
-=======
->>>>>>> 4123c1f (new forcegraph3d ui)
-        if include_documents:
-            doc_results = await r2r_service.search(
+        async def _docs():
+            return await r2r_service.search(
                 query=query,
                 search_type="hybrid",
                 limit=limit
             )
+
+        async def _graph():
+            return await neo4j_service.search_entities(
+                query=query,
+                types=entity_types if entity_types else None,
+                limit=limit
+            )
+
+        # The two branches hit different systems; run them concurrently.
+        doc_results, graph_results = await asyncio.gather(
+            _docs() if include_documents else _noop(),
+            _graph() if include_graph else _noop()
+        )
+
+        if include_documents:
             results["sources"].append({
                 "type": "documents",
                 "count": len(doc_results),
                 "results": doc_results
             })
 
-<<<<<<< HEAD
-
-=======
->>>>>>> 4123c1f (new forcegraph3d ui)
         if include_graph:
-            from ...models.entities import EntityFilter
-
-            entity_filter = EntityFilter(
-                types=entity_types if entity_types else None
-            )
-
-            graph_results = await neo4j_service.find_entities(
-                filter=entity_filter,
-                limit=limit
-            )
-
-            filtered_graph = [
-                e for e in graph_results
-                if query.lower() in e.get("name", "").lower()
-                or query.lower() in e.get("description", "").lower()
-            ]
-
             results["sources"].append({
                 "type": "graph",
-                "count": len(filtered_graph),
-                "results": filtered_graph
+                "count": len(graph_results),
+                "results": graph_results
             })
 
         results["total_count"] = sum(s["count"] for s in results["sources"])
@@ -194,9 +228,11 @@ async def semantic_search(
     entity_types: Optional[List[str]] = None,
     threshold: float = 0.7,
     include_documents: bool = True,
+    search_query: Optional[str] = None,
     vector_service: VectorService = Depends(get_vector_service),
     r2r_service: R2RService = Depends(get_r2r_service),
-    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+    neo4j_service: Neo4jService = Depends(get_neo4j_service),
+    semantic_cache=Depends(get_semantic_cache)
 ):
     """
     Perform semantic search using embeddings.
@@ -207,32 +243,52 @@ async def semantic_search(
         entity_types: Filter by entity types
         threshold: Similarity threshold
         include_documents: Include document search
+        search_query: Query text for the document search
 
     Returns:
         Semantically similar results
     """
     try:
+        cache_params = [
+            limit, entity_types, threshold, include_documents, search_query
+        ]
+        if semantic_cache:
+            cached = await semantic_cache.get_by_embedding(query_embedding)
+            if cached is not None and cached["params"] == cache_params:
+                return cached["response"]
+
         results = {
             "embedding_dimension": len(query_embedding),
             "threshold": threshold,
             "sources": []
         }
 
-        entity_results = await vector_service.similarity_search(
-            query_embedding=query_embedding,
-            limit=limit,
-            entity_types=entity_types,
-            threshold=threshold
+        entity_results, doc_results = await asyncio.gather(
+            vector_service.similarity_search(
+                query_embedding=query_embedding,
+                limit=limit,
+                entity_types=entity_types,
+                threshold=threshold
+            ),
+            # R2R needs query text; an empty-string vector search is a
+            # wasted HTTP call, so only search documents when the caller
+            # supplied one.
+            r2r_service.search(
+                query=search_query,
+                search_type="vector",
+                limit=limit
+            ) if include_documents and search_query else _noop()
         )
 
-        enriched_entities = []
-        for item in entity_results:
-            entity = await neo4j_service.get_entity(item["entity_id"])
-            if entity:
-                enriched_entities.append({
-                    **item,
-                    "entity": entity
-                })
+        entities = await neo4j_service.get_entities_by_ids(
+            [item["entity_id"] for item in entity_results]
+        )
+
+        enriched_entities = [
+            {**item, "entity": entities[item["entity_id"]]}
+            for item in entity_results
+            if item["entity_id"] in entities
+        ]
 
         results["sources"].append({
             "type": "entities",
@@ -240,17 +296,7 @@ async def semantic_search(
             "results": enriched_entities
         })
 
-        if include_documents:
-            doc_results = await r2r_service.search(
-<<<<<<< HEAD
-                query="", 
-=======
-                query="",
->>>>>>> 4123c1f (new forcegraph3d ui)
-                search_type="vector",
-                limit=limit
-            )
-
+        if doc_results is not None:
             results["sources"].append({
                 "type": "documents",
                 "count": len(doc_results),
@@ -259,6 +305,12 @@ async def semantic_search(
 
         results["total_count"] = sum(s["count"] for s in results["sources"])
 
+        if semantic_cache:
+            await semantic_cache.set_by_embedding(
+                query_embedding,
+                {"params": cache_params, "response": results}
+            )
+
         return results
 
     except Exception as e:
@@ -266,6 +318,69 @@ async def semantic_search(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/semantic/batch")
+async def semantic_search_batch(
+    query_embeddings: List[List[float]],
+    limit: int = 10,
+    entity_types: Optional[List[str]] = None,
+    threshold: float = 0.7,
+    vector_service: VectorService = Depends(get_vector_service),
+    neo4j_service: Neo4jService = Depends(get_neo4j_service)
+):
+    """
+    Perform semantic search for multiple query embeddings at once.
+
+    Args:
+        query_embeddings: Query embedding vectors (max 100)
+        limit: Maximum results per query
+        entity_types: Filter by entity types
+        threshold: Similarity threshold
+
+    Returns:
+        Per-query results in input order
+    """
+    if len(query_embeddings) > 100:
+        raise HTTPException(
+            status_code=422,
+            detail="At most 100 query embeddings per batch"
+        )
+
+    try:
+        batched = await vector_service.similarity_search_batch(
+            query_embeddings=query_embeddings,
+            limit=limit,
+            entity_types=entity_types,
+            threshold=threshold
+        )
+
+        all_ids = [
+            item["entity_id"] for items in batched for item in items
+        ]
+        entities = await neo4j_service.get_entities_by_ids(all_ids)
+
+        results = [
+            {
+                "count": len(items),
+                "results": [
+                    {**item, "entity": entities[item["entity_id"]]}
+                    for item in items
+                    if item["entity_id"] in entities
+                ]
+            }
+            for items in batched
+        ]
+
+        return {
+            "query_count": len(query_embeddings),
+            "threshold": threshold,
+            "results": results
+        }
+
+    except Exception as e:
+        logger.error("Batch semantic search failed", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/contextual")
 async def contextual_search(
     query: str,
@@ -288,18 +403,21 @@ async def contextual_search(
         Contextual search results
     """
     try:
-        related_entities = []
-        for entity_id in context_entity_ids:
-            from ...models.relationships import GraphTraversalRequest
-
-            traversal = GraphTraversalRequest(
-                start_entity_id=entity_id,
+        # No context entities means no traversal: fall through to a
+        # plain document search instead of dividing by zero.
+        traversals = (
+            await neo4j_service.traverse_graph_bulk(
+                start_ids=context_entity_ids,
                 max_depth=max_depth,
-                limit=limit // len(context_entity_ids)
+                limit_per=max(1, limit // len(context_entity_ids))
             )
+            if context_entity_ids
+            else {}
+        )
 
-            traversal_result = await neo4j_service.traverse_graph(traversal)
-            related_entities.extend(traversal_result["nodes"])
+        related_entities = []
+        for nodes in traversals.values():
+            related_entities.extend(nodes)
 
         entity_names = list(set(
             e.get("name", "") for e in related_entities
@@ -329,6 +447,7 @@ async def contextual_search(
 
 @router.get("/suggestions")
 async def get_search_suggestions(
+    response: Response,
     partial_query: str,
     limit: int = 5,
     neo4j_service: Neo4jService = Depends(get_neo4j_service)
@@ -344,25 +463,8 @@ async def get_search_suggestions(
         List of search suggestions
     """
     try:
-        from ...models.entities import EntityFilter
-
-        entities = await neo4j_service.find_entities(limit=100)
-<<<<<<< HEAD
-
-=======
->>>>>>> 4123c1f (new forcegraph3d ui)
-        suggestions = []
-        for entity in entities:
-            name = entity.get("name", "")
-            if partial_query.lower() in name.lower():
-                suggestions.append({
-                    "text": name,
-                    "type": entity.get("type", "unknown"),
-                    "entity_id": entity.get("id")
-                })
-
-                if len(suggestions) >= limit:
-                    break
+        response.headers["Cache-Control"] = "max-age=5"
+        suggestions = await neo4j_service.suggest(partial_query, limit=limit)
 
         return {
             "query": partial_query,
@@ -401,13 +503,14 @@ async def get_entity_clusters(
             min_cluster_size=min_cluster_size
         )
 
+        unique_ids = list({eid for cluster in clusters for eid in cluster})
+        entities = await neo4j_service.get_entities_by_ids(unique_ids)
+
         enriched_clusters = []
         for cluster in clusters:
-            cluster_entities = []
-            for entity_id in cluster:
-                entity = await neo4j_service.get_entity(entity_id)
-                if entity:
-                    cluster_entities.append(entity)
+            cluster_entities = [
+                entities[eid] for eid in cluster if eid in entities
+            ]
 
             if cluster_entities:
                 enriched_clusters.append({
@@ -0,0 +1,20 @@
+"""Shared helpers for API routes."""
+
+from hashlib import blake2b
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that serializes numpy arrays and scalars natively."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def weak_etag(*parts: str) -> str:
+    """Build a weak ETag from the given version parts."""
+    digest = blake2b("|".join(parts).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, computed_field
@@ -20,10 +21,12 @@ class Settings(BaseSettings):
 
     api_v1_prefix: str = "/api/v1"
     cors_origins: list[str] = Field(default=["*"], description="CORS allowed origins")
+    cors_methods: list[str] = Field(default=["GET", "POST", "PUT", "DELETE", "OPTIONS"], description="CORS allowed methods")
+    cors_headers: list[str] = Field(default=["Content-Type", "Authorization", "X-Request-ID"], description="CORS allowed headers")
 
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, description="Server port")
-    workers: int = Field(default=1, description="Number of workers")
+    workers: int = Field(default=0, description="Number of uvicorn workers (0 = auto: WEB_CONCURRENCY or 2*cores+1)")
 
     secret_key: str = Field(default="your-secret-key-change-in-production", description="Secret key for JWT")
     algorithm: str = Field(default="HS256", description="JWT algorithm")
@@ -34,9 +37,17 @@ class Settings(BaseSettings):
     postgres_host: str = Field(default="localhost", description="PostgreSQL host")
     postgres_port: int = Field(default=5432, description="PostgreSQL port")
     postgres_db: str = Field(default="graphaura", description="PostgreSQL database name")
-
+    # pool_max should exceed uvicorn workers x expected concurrent DB ops
+    postgres_pool_min: int = Field(default=10, description="PostgreSQL pool minimum size")
+    postgres_pool_max: int = Field(default=50, description="PostgreSQL pool maximum size")
+    postgres_statement_cache_size: int = Field(default=1024, description="asyncpg prepared-statement cache size")
+    postgres_acquire_timeout: float = Field(default=5.0, description="Seconds to wait for a pool connection before failing fast")
+    pgbouncer_mode: bool = Field(default=False, description="Disable the statement cache when connecting through PgBouncer/Supabase pooler")
+
+    # Settings are frozen after import, so the derived URLs are memoized
+    # rather than rebuilding an f-string on every access.
     @computed_field
-    @property
+    @cached_property
     def postgres_url(self) -> str:
         return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
 
@@ -44,6 +55,9 @@ class Settings(BaseSettings):
     neo4j_user: str = Field(default="neo4j", description="Neo4j user")
     neo4j_password: str = Field(default="password", description="Neo4j password")
     neo4j_database: str = Field(default="neo4j", description="Neo4j database name")
+    neo4j_pool_size: int = Field(default=100, description="Max Bolt connections in the driver pool")
+    neo4j_acquire_timeout: float = Field(default=5.0, description="Seconds to wait for a Bolt connection before failing fast")
+    neo4j_fetch_size: int = Field(default=10_000, description="Records per Bolt fetch batch on read sessions")
 
     r2r_base_url: str = Field(default="http://localhost:7272", description="R2R API base URL")
     r2r_api_key: Optional[str] = Field(default=None, description="R2R API key if required")
@@ -54,17 +68,21 @@ class Settings(BaseSettings):
     redis_password: Optional[str] = Field(default=None, description="Redis password")
 
     @computed_field
-    @property
+    @cached_property
     def redis_url(self) -> str:
         if self.redis_password:
             return f"redis://:{self.redis_password}@{self.redis_host}:{self.redis_port}/{self.redis_db}"
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
     vector_dimension: int = Field(default=512, description="Vector embedding dimension")
+    hnsw_ef_search: int = Field(default=40, description="pgvector hnsw.ef_search candidate-list size per query")
     similarity_threshold: float = Field(default=0.7, description="Similarity threshold for vector search")
     max_search_results: int = Field(default=50, description="Maximum number of search results")
     max_graph_depth: int = Field(default=3, description="Maximum depth for graph traversal")
     batch_size: int = Field(default=100, description="Batch size for processing")
+    batch_upload_concurrency: int = Field(default=8, description="Max concurrent ingestions in batch upload")
+
+    health_check_interval_seconds: int = Field(default=10, description="Seconds between background health probe refreshes")
 
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(default="json", description="Log format (json or text)")
@@ -1,4 +1,5 @@
 from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j.exceptions import ClientError
 from typing import Optional
 import structlog
 
@@ -16,7 +17,10 @@ class Neo4jDB:
             self.driver = AsyncGraphDatabase.driver(
                 settings.neo4j_uri,
                 auth=(settings.neo4j_user, settings.neo4j_password),
-                max_connection_lifetime=3600
+                max_connection_lifetime=3600,
+                max_connection_pool_size=settings.neo4j_pool_size,
+                connection_acquisition_timeout=settings.neo4j_acquire_timeout,
+                keep_alive=True
             )
 
             await self.driver.verify_connectivity()
@@ -38,31 +42,32 @@ class Neo4jDB:
             logger.info("Disconnected from Neo4j")
 
     async def _init_schema(self):
-        async with self.driver.session(database=settings.neo4j_database) as session:
-            try:
-                await session.run("""
-                    CREATE CONSTRAINT entity_id_unique IF NOT EXISTS
-                    FOR (e:Entity) REQUIRE e.id IS UNIQUE
-                """)
-            except:
-                pass  # Constraint might already exist
+        schema_queries = [
+            """CREATE CONSTRAINT entity_id_unique IF NOT EXISTS
+               FOR (e:Entity) REQUIRE e.id IS UNIQUE""",
+            "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
+            "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)",
+            "CREATE INDEX entity_created IF NOT EXISTS FOR (e:Entity) ON (e.created_at)",
+            "CREATE INDEX person_id IF NOT EXISTS FOR (p:Person) ON (p.id)",
+            "CREATE INDEX event_id IF NOT EXISTS FOR (e:Event) ON (e.id)",
+            "CREATE INDEX location_id IF NOT EXISTS FOR (l:Location) ON (l.id)",
+            "CREATE INDEX organization_id IF NOT EXISTS FOR (o:Organization) ON (o.id)",
+            "CREATE INDEX document_id IF NOT EXISTS FOR (d:Document) ON (d.id)",
+            """CREATE FULLTEXT INDEX entity_search IF NOT EXISTS
+               FOR (e:Entity) ON EACH [e.name, e.description]"""
+        ]
 
-            indices = [
-                "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)",
-                "CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)",
-                "CREATE INDEX entity_created IF NOT EXISTS FOR (e:Entity) ON (e.created_at)",
-                "CREATE INDEX person_id IF NOT EXISTS FOR (p:Person) ON (p.id)",
-                "CREATE INDEX event_id IF NOT EXISTS FOR (e:Event) ON (e.id)",
-                "CREATE INDEX location_id IF NOT EXISTS FOR (l:Location) ON (l.id)",
-                "CREATE INDEX organization_id IF NOT EXISTS FOR (o:Organization) ON (o.id)",
-                "CREATE INDEX document_id IF NOT EXISTS FOR (d:Document) ON (d.id)"
-            ]
+        async def create_schema(tx):
+            for query in schema_queries:
+                await tx.run(query)
 
-            for index_query in indices:
-                try:
-                    await session.run(index_query)
-                except:
-                    pass  # Index might already exist
+        async with self.driver.session(database=settings.neo4j_database) as session:
+            try:
+                # One write transaction: one commit round-trip instead of
+                # one per statement. IF NOT EXISTS covers re-runs.
+                await session.execute_write(create_schema)
+            except ClientError as e:
+                logger.warning("Neo4j schema initialization skipped", error=str(e))
 
             logger.info("Neo4j schema initialized")
 
@@ -1,5 +1,7 @@
 """PostgreSQL database connection and management."""
 
+import asyncio
+
 import asyncpg
 from typing import Optional, Dict, Any
 import structlog
@@ -25,13 +27,17 @@ class PostgresDB:
                 user=settings.postgres_user,
                 password=settings.postgres_password,
                 database=settings.postgres_db,
-                min_size=10,
-                max_size=20,
+                min_size=settings.postgres_pool_min,
+                max_size=settings.postgres_pool_max,
                 command_timeout=60,
-                statement_cache_size=0  # Required for PgBouncer/Supabase pooler
+                statement_cache_size=(
+                    0 if settings.pgbouncer_mode
+                    else settings.postgres_statement_cache_size
+                )
             )
 
             await self._init_schema()
+            await self._warm_pool()
 
             logger.info(
                 "Connected to PostgreSQL",
@@ -48,9 +54,16 @@ class PostgresDB:
             await self.pool.close()
             logger.info("Disconnected from PostgreSQL")
 
+    async def _warm_pool(self):
+        """Exercise min_size connections so no request pays first-use cost."""
+        await asyncio.gather(*(
+            self.pool.execute("SELECT 1")
+            for _ in range(settings.postgres_pool_min)
+        ))
+
     async def _init_schema(self):
         """Initialize database schema."""
-        async with self.pool.acquire() as conn:
+        async with self.pool.acquire(timeout=settings.postgres_acquire_timeout) as conn:
             await conn.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
             await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
 
@@ -89,20 +102,21 @@ class PostgresDB:
 
             logger.info("PostgreSQL schema initialized")
 
+    # Single-statement helpers go through the pool's convenience methods,
+    # which handle acquire/release internally. Use pool.acquire() directly
+    # only for multi-statement transactions.
+
     async def execute(self, query: str, *args):
         """Execute a query."""
-        async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+        return await self.pool.execute(query, *args)
 
     async def fetchone(self, query: str, *args):
         """Fetch a single row."""
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self.pool.fetchrow(query, *args)
 
     async def fetchall(self, query: str, *args):
         """Fetch all rows."""
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self.pool.fetch(query, *args)
 
     async def log_audit(
         self,
@@ -113,8 +127,7 @@ class PostgresDB:
         changes: Optional[Dict[str, Any]] = None
     ):
         """Log an audit entry."""
-        async with self.pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO audit_log (entity_type, entity_id, action, user_id, changes)
-                VALUES ($1, $2, $3, $4, $5)
-            """, entity_type, entity_id, action, user_id, changes or {})
\ No newline at end of file
+        await self.pool.execute("""
+            INSERT INTO audit_log (entity_type, entity_id, action, user_id, changes)
+            VALUES ($1, $2, $3, $4, $5)
+        """, entity_type, entity_id, action, user_id, changes or {})
\ No newline at end of file
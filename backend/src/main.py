@@ -1,36 +1,127 @@
+import asyncio
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+
+import msgspec
+import orjson
+from async_lru import alru_cache
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncpg
+import httpx
 import structlog
 import uvicorn
+from neo4j.exceptions import Neo4jError, DriverError
 
 from .config import settings
 from .database import PostgresDB, Neo4jDB
-from .services import Neo4jService, VectorService, R2RService
+from .services import (
+    Neo4jService,
+    VectorService,
+    R2RService,
+    EmbeddingCoalescer,
+    SemanticCache
+)
+from .services.r2r_service import aclose_httpx
 
 from .api.routes import documents, graph, search
+from .api.utils import NumpyORJSONResponse
+
+# Log writes go through a queue drained by a dedicated thread so request
+# handlers never block the event loop on a stdout write syscall.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+
+class _QueueWriter:
+    """File-like object that enqueues rendered log lines."""
+
+    def write(self, data: bytes):
+        _log_queue.put_nowait(data)
+
+    def flush(self):
+        pass
+
+
+def _drain_log_queue():
+    stream = sys.stdout.buffer
+    while True:
+        item = _log_queue.get()
+        if item is None:
+            break
+        stream.write(item)
+        stream.flush()
+
+
+_log_writer_thread = threading.Thread(
+    target=_drain_log_queue, name="log-writer", daemon=True
+)
+_log_writer_thread.start()
+
+
+def _stop_log_writer():
+    """Flush remaining records and stop the writer thread."""
+    _log_queue.put_nowait(None)
+    _log_writer_thread.join(timeout=5)
+
+
+# Native structlog pipeline: no stdlib logging round-trip, orjson
+# rendering straight to bytes in JSON mode. Level filtering happens in
+# the bound logger instead of the dropped stdlib filter processor.
+_shared_processors = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    *([structlog.processors.StackInfoRenderer()] if settings.debug else []),
+    structlog.processors.format_exc_info,
+]
 
 structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer() if settings.log_format == "json"
-        else structlog.dev.ConsoleRenderer()
-    ],
+    processors=_shared_processors + (
+        [structlog.processors.JSONRenderer(serializer=orjson.dumps)]
+        if settings.log_format == "json"
+        else [structlog.dev.ConsoleRenderer()]
+    ),
     context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
+    wrapper_class=structlog.make_filtering_bound_logger(
+        getattr(logging, settings.log_level.upper(), logging.INFO)
+    ),
+    logger_factory=(
+        structlog.BytesLoggerFactory(file=_QueueWriter())
+        if settings.log_format == "json"
+        else structlog.PrintLoggerFactory()
+    ),
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger(__name__)
 
+
+def _render_msgpack(logger, name, event_dict):
+    return msgspec.msgpack.encode(event_dict)
+
+
+# Access records are high-volume and machine-consumed, so they skip JSON
+# entirely: msgpack-encoded bytes through the same queued writer. In text
+# mode they fall back to the ordinary console pipeline.
+access_logger = (
+    structlog.wrap_logger(
+        structlog.BytesLogger(file=_QueueWriter()),
+        processors=[
+            structlog.processors.TimeStamper(fmt=None, utc=True),
+            _render_msgpack,
+        ],
+    )
+    if settings.log_format == "json"
+    else structlog.get_logger("access")
+)
+
 postgres_db = PostgresDB()
 neo4j_db = Neo4jDB()
 
@@ -57,10 +148,18 @@ async def lifespan(app: FastAPI):
             vector_service = VectorService()
             await vector_service.connect()
             app.state.vector_service = vector_service
+
+            embedding_coalescer = EmbeddingCoalescer(vector_service)
+            embedding_coalescer.start()
+            app.state.embedding_coalescer = embedding_coalescer
+
             logger.info("Vector service connected successfully")
         except Exception as e:
             logger.warning("Vector service connection failed", error=str(e))
             app.state.vector_service = None
+            app.state.embedding_coalescer = None
+
+        app.state.semantic_cache = SemanticCache()
 
         try:
             r2r_service = R2RService()
@@ -70,6 +169,9 @@ async def lifespan(app: FastAPI):
             logger.warning("R2R service initialization failed", error=str(e))
             app.state.r2r_service = None
 
+        app.state.health_cache = None
+        app.state.health_task = asyncio.create_task(_health_loop(app))
+
         logger.info("Core services initialized successfully")
 
     except Exception as e:
@@ -81,23 +183,31 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down GraphAura backend")
 
     try:
+        if hasattr(app.state, 'health_task') and app.state.health_task:
+            app.state.health_task.cancel()
         await postgres_db.disconnect()
         if neo4j_db.driver:
             await neo4j_db.disconnect()
         if hasattr(app.state, 'r2r_service') and app.state.r2r_service:
             await app.state.r2r_service.cleanup()
+        if hasattr(app.state, 'embedding_coalescer') and app.state.embedding_coalescer:
+            await app.state.embedding_coalescer.stop()
         if hasattr(app.state, 'neo4j_service') and app.state.neo4j_service:
             await app.state.neo4j_service.disconnect()
         if hasattr(app.state, 'vector_service') and app.state.vector_service:
             await app.state.vector_service.disconnect()
+        await aclose_httpx()
     except Exception as e:
         logger.error("Error during shutdown", error=str(e))
 
+    _stop_log_writer()
+
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Multi-modal knowledge graph system integrating R2R and Neo4j",
+    default_response_class=NumpyORJSONResponse,
     lifespan=lifespan
 )
 
@@ -105,19 +215,38 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.cors_methods,
+    allow_headers=settings.cors_headers,
+    max_age=86400,  # let browsers cache preflights for a day
 )
 
 
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(
-        "Unhandled exception",
-        error=str(exc),
+@app.middleware("http")
+async def bind_request_context(request: Request, call_next):
+    # Bind request context once; every log line in the request (including
+    # the exception handler) inherits it via merge_contextvars instead of
+    # re-passing kwargs per call.
+    structlog.contextvars.clear_contextvars()
+    structlog.contextvars.bind_contextvars(
+        path=request.url.path,
+        method=request.method,
+        request_id=request.headers.get("x-request-id") or str(uuid.uuid4())
+    )
+    start = time.perf_counter()
+    response = await call_next(request)
+    access_logger.info(
+        "access",
+        method=request.method,
         path=request.url.path,
-        method=request.method
+        status=response.status_code,
+        duration_ms=round((time.perf_counter() - start) * 1000, 2)
     )
+    return response
+
+
+@app.exception_handler(Exception)
+async def global_exception_handler(request: Request, exc: Exception):
+    logger.error("Unhandled exception", error=str(exc))
 
     return JSONResponse(
         status_code=500,
@@ -128,47 +257,94 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+async def _health_loop(app: FastAPI):
+    """Refresh the cached health snapshot in the background."""
+    while True:
+        try:
+            app.state.health_cache = await _probe_health()
+        except Exception as e:
+            logger.error("Health probe failed", error=str(e))
+        await asyncio.sleep(settings.health_check_interval_seconds)
+
+
+@app.get("/ping")
+async def ping():
+    """Constant-time liveness endpoint for load balancers."""
+    return {"ok": True}
+
+
 @app.get("/health")
-async def health_check():
-    health_status = {
-        "status": "healthy",
-        "environment": settings.environment,
-        "version": settings.app_version,
-        "services": {}
-    }
+async def health_check(response: Response):
+    # Probes run on a background refresh loop; serving the cached
+    # snapshot keeps this endpoint free of backend round-trips no
+    # matter how many replicas poll it.
+    response.headers["Cache-Control"] = (
+        f"max-age={settings.health_check_interval_seconds}"
+    )
+    cached = getattr(app.state, "health_cache", None)
+    if cached is not None:
+        return cached
+    return await _probe_health()
 
-    try:
-        await postgres_db.fetchone("SELECT 1")
-        health_status["services"]["postgres"] = "healthy"
-    except:
-        health_status["services"]["postgres"] = "unhealthy"
-        health_status["status"] = "degraded"
 
-    try:
-        if neo4j_db.driver:
-            await neo4j_db.driver.verify_connectivity()
-            health_status["services"]["neo4j"] = "healthy"
-        else:
-            health_status["services"]["neo4j"] = "disconnected"
-            health_status["status"] = "degraded"
-    except:
-        health_status["services"]["neo4j"] = "unhealthy"
-        health_status["status"] = "degraded"
+async def _probe_health():
+    # Typed exception handlers only: a bare except here would also swallow
+    # CancelledError on client disconnect and report a healthy DB.
+    async def _check_pg():
+        try:
+            await postgres_db.fetchone("SELECT 1")
+            return ("postgres", "healthy")
+        except (asyncpg.PostgresError, ConnectionError, TimeoutError):
+            return ("postgres", "unhealthy")
 
-    try:
-        from .services import R2RService
-        async with R2RService() as r2r:
-            r2r_health = await r2r.health_check()
-            if r2r_health.get("status") == "healthy":
-                health_status["services"]["r2r"] = "healthy"
-            else:
-                health_status["services"]["r2r"] = "unhealthy"
-                health_status["status"] = "degraded"
-    except:
-        health_status["services"]["r2r"] = "unhealthy"
-        health_status["status"] = "degraded"
+    async def _check_neo4j():
+        try:
+            if neo4j_db.driver:
+                await neo4j_db.driver.verify_connectivity()
+                return ("neo4j", "healthy")
+            return ("neo4j", "disconnected")
+        except (Neo4jError, DriverError, ConnectionError, TimeoutError):
+            return ("neo4j", "unhealthy")
+
+    async def _check_r2r():
+        try:
+            if app.state.r2r_service:
+                r2r_health = await app.state.r2r_service.health_check()
+                if r2r_health.get("status") == "healthy":
+                    return ("r2r", "healthy")
+                return ("r2r", "unhealthy")
+            return ("r2r", "disconnected")
+        except (httpx.HTTPError, ConnectionError, TimeoutError):
+            return ("r2r", "unhealthy")
+
+    # Independent probes: total latency is the slowest one, not the sum.
+    probe_names = ("postgres", "neo4j", "r2r")
+    results = await asyncio.gather(
+        _check_pg(),
+        _check_neo4j(),
+        _check_r2r(),
+        return_exceptions=True
+    )
 
-    return health_status
+    services = {}
+    for name, result in zip(probe_names, results):
+        if isinstance(result, BaseException):
+            # An exception outside the typed handlers still means the
+            # probe failed; report the service unhealthy rather than
+            # dropping it from the snapshot.
+            logger.error("Health probe raised", service=name, error=str(result))
+            services[name] = "unhealthy"
+            continue
+        services[result[0]] = result[1]
+
+    degraded = any(status != "healthy" for status in services.values())
+
+    return {
+        "status": "degraded" if degraded else "healthy",
+        "environment": settings.environment,
+        "version": settings.app_version,
+        "services": services
+    }
 
 
 @app.get("/")
@@ -182,46 +358,42 @@ async def root():
     }
 
 
-app.include_router(
-    documents.router,
-    prefix=f"{settings.api_v1_prefix}",
-    tags=["documents"]
-)
+v1_router = APIRouter(prefix=settings.api_v1_prefix)
+v1_router.include_router(documents.router, tags=["documents"])
+v1_router.include_router(graph.router, tags=["graph"])
+v1_router.include_router(search.router, tags=["search"])
 
-app.include_router(
-    graph.router,
-    prefix=f"{settings.api_v1_prefix}",
-    tags=["graph"]
-)
-
-app.include_router(
-    search.router,
-    prefix=f"{settings.api_v1_prefix}",
-    tags=["search"]
-)
+app.include_router(v1_router)
 
 
 @app.get("/metrics")
-async def metrics():
+async def metrics(response: Response):
+    response.headers["Cache-Control"] = "max-age=15"
+    return await _metrics_snapshot()
+
+
+@alru_cache(maxsize=1, ttl=15)
+async def _metrics_snapshot():
     try:
-        from .services import VectorService
-        async with VectorService() as vector_service:
-            vector_stats = await vector_service.get_statistics()
-
-        from .services import Neo4jService
-        async with Neo4jService() as neo4j_service:
-            entity_count = await neo4j_service.execute_cypher(
-                "MATCH (e:Entity) RETURN count(e) as count"
-            )
-            relationship_count = await neo4j_service.execute_cypher(
-                "MATCH ()-[r]->() RETURN count(r) as count"
-            )
+        vector_service = app.state.vector_service
+        neo4j_service = app.state.neo4j_service
+
+        vector_stats = await vector_service.get_statistics() if vector_service else {}
+
+        graph_counts = []
+        if neo4j_service:
+            # Both counts in one query: one round-trip, one parse.
+            graph_counts = await neo4j_service.execute_cypher("""
+                CALL { MATCH (e:Entity) RETURN count(e) as entities }
+                CALL { MATCH ()-[r]->() RETURN count(r) as relationships }
+                RETURN entities, relationships
+            """)
 
         return {
             "vector_embeddings": vector_stats,
             "graph": {
-                "entities": entity_count[0]["count"] if entity_count else 0,
-                "relationships": relationship_count[0]["count"] if relationship_count else 0
+                "entities": graph_counts[0]["entities"] if graph_counts else 0,
+                "relationships": graph_counts[0]["relationships"] if graph_counts else 0
             }
         }
     except Exception as e:
@@ -230,12 +402,26 @@ async def metrics():
 
 
 def run_server():
+    # Note: app.state caches (health snapshot, semantic cache) are
+    # per-worker; anything that must be shared across workers belongs
+    # in Redis.
+    workers = (
+        settings.workers
+        or int(os.environ.get("WEB_CONCURRENCY", 0))
+        or 2 * (os.cpu_count() or 1) + 1
+    )
+
     uvicorn.run(
         "src.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        workers=settings.workers if not settings.debug else 1,
+        workers=workers if not settings.debug else 1,
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.debug,
+        server_header=False,
+        date_header=False,
         log_level=settings.log_level.lower()
     )
 
@@ -1,10 +1,78 @@
 """Entity models for GraphAura knowledge graph."""
 
-from datetime import datetime
-from typing import Optional, Any, Dict, List
+import binascii
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Optional, Any, Dict, List, ClassVar
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
-import uuid
+
+_frozen_now: ContextVar[Optional[datetime]] = ContextVar(
+    "_frozen_now", default=None
+)
+
+
+class _UUIDBuf:
+    """Batched random-ID source for model default factories.
+
+    Bulk ingestion constructs thousands of models, and ``str(uuid.uuid4())``
+    pays a syscall plus UUID-object construction per id. One os.urandom
+    call fills a buffer good for 4096 ids; formatting is a hexlify and
+    four slices, with no intermediate UUID object.
+    """
+
+    _BATCH = 4096
+
+    def __init__(self):
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def next_uuid_str(self) -> str:
+        with self._lock:
+            if self._pos >= len(self._buf):
+                self._buf = os.urandom(16 * self._BATCH)
+                self._pos = 0
+            raw = bytearray(self._buf[self._pos:self._pos + 16])
+            self._pos += 16
+        # Set the version/variant bits so the result is a valid UUIDv4.
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        h = binascii.hexlify(raw).decode("ascii")
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_uuid_buf = _UUIDBuf()
+_next_uuid_str = _uuid_buf.next_uuid_str
+
+
+def _now() -> datetime:
+    """Current UTC time, or the batch timestamp inside frozen_now()."""
+    frozen = _frozen_now.get()
+    if frozen is not None:
+        return frozen
+    return datetime.now(timezone.utc)
+
+
+@contextmanager
+def frozen_now():
+    """
+    Freeze model timestamps for the duration of a batch.
+
+    Bulk ingestion constructs thousands of entities whose created_at/
+    updated_at defaults would each take a clock reading; inside this
+    context they all share one.
+    """
+    timestamp = datetime.now(timezone.utc)
+    token = _frozen_now.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _frozen_now.reset(token)
 
 
 class EntityType(str, Enum):
@@ -18,11 +86,15 @@ class EntityType(str, Enum):
     ARTIFACT = "artifact"
 
 
+# Plain dict lookup beats enum descriptor access on the serialization path
+_ENTITY_VALUES = {member: member.value for member in EntityType}
+
+
 class Entity(BaseModel):
     """Base entity model."""
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_next_uuid_str)
     type: EntityType
     name: str = Field(..., min_length=1, max_length=500)
     description: Optional[str] = Field(None, max_length=5000)
@@ -31,22 +103,29 @@ class Entity(BaseModel):
     embedding: Optional[List[float]] = Field(None, description="Vector embedding")
     source_documents: List[str] = Field(default_factory=list, description="Document IDs")
     confidence_score: float = Field(default=1.0, ge=0.0, le=1.0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+
+    # Plain-valued fields copied verbatim into Neo4j properties; the
+    # enum and datetime fields need conversion and are handled apart.
+    _NEO4J_FIELDS: ClassVar[tuple] = (
+        "id", "name", "description", "tags", "confidence_score"
+    )
+    _NEO4J_GETTER: ClassVar = attrgetter(*_NEO4J_FIELDS)
 
     def to_neo4j(self) -> Dict[str, Any]:
         """Convert to Neo4j node properties."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "type": self.type.value,
-            "tags": self.tags,
-            "confidence_score": self.confidence_score,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            **self.properties
-        }
+        props = dict(zip(self._NEO4J_FIELDS, self._NEO4J_GETTER(self)))
+        props["type"] = _ENTITY_VALUES[self.type]
+        props["created_at"] = self.created_at.isoformat()
+        props["updated_at"] = self.updated_at.isoformat()
+        props.update(self.properties)
+        return props
+
+    @classmethod
+    def batch_to_neo4j(cls, entities: List["Entity"]) -> List[Dict[str, Any]]:
+        """Convert many entities to Neo4j properties in one pass."""
+        return [entity.to_neo4j() for entity in entities]
 
 
 class Person(Entity):
@@ -0,0 +1,141 @@
+"""msgspec counterparts of the core models for internal ingestion.
+
+Pydantic stays at the HTTP boundary for validation and OpenAPI; these
+structs cover trusted internal bulk paths (entity extraction results,
+batch graph writes) where per-field validator dispatch would dominate.
+"""
+
+from datetime import datetime
+from typing import Optional, Any, Dict, List
+
+import msgspec
+
+from .entities import Entity, _next_uuid_str as _new_id, _now
+from .relationships import Relationship
+
+
+class EntityMsg(msgspec.Struct, kw_only=True):
+    """Validation-free counterpart of Entity for bulk ingestion."""
+
+    type: str
+    name: str
+    id: str = msgspec.field(default_factory=_new_id)
+    description: Optional[str] = None
+    properties: Dict[str, Any] = msgspec.field(default_factory=dict)
+    tags: List[str] = msgspec.field(default_factory=list)
+    embedding: Optional[List[float]] = None
+    source_documents: List[str] = msgspec.field(default_factory=list)
+    confidence_score: float = 1.0
+    created_at: datetime = msgspec.field(default_factory=_now)
+    updated_at: datetime = msgspec.field(default_factory=_now)
+
+    @classmethod
+    def from_entity(cls, entity: Entity) -> "EntityMsg":
+        """Build from a validated Entity."""
+        return cls(
+            id=entity.id,
+            type=entity.type.value,
+            name=entity.name,
+            description=entity.description,
+            properties=entity.properties,
+            tags=entity.tags,
+            embedding=entity.embedding,
+            source_documents=entity.source_documents,
+            confidence_score=entity.confidence_score,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at
+        )
+
+    def to_entity(self) -> Entity:
+        """Validate back into the pydantic model for the HTTP boundary."""
+        return Entity.model_validate(msgspec.to_builtins(self))
+
+    def to_neo4j(self) -> Dict[str, Any]:
+        """Convert to Neo4j node properties."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "type": self.type,
+            "tags": self.tags,
+            "confidence_score": self.confidence_score,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            **self.properties
+        }
+
+
+class RelationshipMsg(msgspec.Struct, kw_only=True):
+    """Validation-free counterpart of Relationship for bulk ingestion."""
+
+    source_id: str
+    target_id: str
+    type: str
+    id: str = msgspec.field(default_factory=_new_id)
+    properties: Dict[str, Any] = msgspec.field(default_factory=dict)
+    weight: float = 1.0
+    confidence_score: float = 1.0
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    source_documents: List[str] = msgspec.field(default_factory=list)
+    evidence: List[str] = msgspec.field(default_factory=list)
+    created_at: datetime = msgspec.field(default_factory=_now)
+    updated_at: datetime = msgspec.field(default_factory=_now)
+
+    @classmethod
+    def from_relationship(cls, relationship: Relationship) -> "RelationshipMsg":
+        """Build from a validated Relationship."""
+        return cls(
+            id=relationship.id,
+            source_id=relationship.source_id,
+            target_id=relationship.target_id,
+            type=relationship.type.value,
+            properties=relationship.properties,
+            weight=relationship.weight,
+            confidence_score=relationship.confidence_score,
+            start_date=relationship.start_date,
+            end_date=relationship.end_date,
+            source_documents=relationship.source_documents,
+            evidence=relationship.evidence,
+            created_at=relationship.created_at,
+            updated_at=relationship.updated_at
+        )
+
+    def to_relationship(self) -> Relationship:
+        """Validate back into the pydantic model for the HTTP boundary."""
+        return Relationship.model_validate(msgspec.to_builtins(self))
+
+    def to_neo4j(self) -> Dict[str, Any]:
+        """Convert to Neo4j relationship properties."""
+        props = {
+            "id": self.id,
+            "type": self.type,
+            "weight": self.weight,
+            "confidence_score": self.confidence_score,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+        if self.start_date:
+            props["start_date"] = self.start_date.isoformat()
+        if self.end_date:
+            props["end_date"] = self.end_date.isoformat()
+
+        props.update(self.properties)
+        return props
+
+
+# Reusable decoders: msgspec compiles the struct layout once, so bulk
+# payloads decode straight into structs with no per-field dispatch.
+_ENTITY_LIST_DECODER = msgspec.json.Decoder(List[EntityMsg])
+_RELATIONSHIP_LIST_DECODER = msgspec.json.Decoder(List[RelationshipMsg])
+
+
+def decode_entities(data: bytes | str) -> List[EntityMsg]:
+    """Decode a JSON array from a trusted source into EntityMsg structs."""
+    return _ENTITY_LIST_DECODER.decode(data)
+
+
+def decode_relationships(data: bytes | str) -> List[RelationshipMsg]:
+    """Decode a JSON array from a trusted source into RelationshipMsg structs."""
+    return _RELATIONSHIP_LIST_DECODER.decode(data)
@@ -1,10 +1,12 @@
 """Relationship models for GraphAura knowledge graph."""
 
 from datetime import datetime
-from typing import Optional, Any, Dict, List
+from operator import attrgetter
+from typing import Optional, Any, Dict, List, ClassVar
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
-import uuid
+
+from .entities import _next_uuid_str, _now
 
 
 class RelationType(str, Enum):
@@ -63,11 +65,15 @@ class RelationType(str, Enum):
     RESULTED_IN = "resulted_in"
 
 
+# Plain dict lookup beats enum descriptor access on the serialization path
+_REL_VALUES = {member: member.value for member in RelationType}
+
+
 class Relationship(BaseModel):
     """Relationship between two entities."""
     model_config = ConfigDict(from_attributes=True)
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_next_uuid_str)
     source_id: str = Field(..., description="Source entity ID")
     target_id: str = Field(..., description="Target entity ID")
     type: RelationType
@@ -86,19 +92,20 @@ class Relationship(BaseModel):
     evidence: List[str] = Field(default_factory=list, description="Text evidence")
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
+
+    # Plain-valued fields copied verbatim into Neo4j properties; the
+    # enum and datetime fields need conversion and are handled apart.
+    _NEO4J_FIELDS: ClassVar[tuple] = ("id", "weight", "confidence_score")
+    _NEO4J_GETTER: ClassVar = attrgetter(*_NEO4J_FIELDS)
 
     def to_neo4j(self) -> Dict[str, Any]:
         """Convert to Neo4j relationship properties."""
-        props = {
-            "id": self.id,
-            "type": self.type.value,
-            "weight": self.weight,
-            "confidence_score": self.confidence_score,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+        props = dict(zip(self._NEO4J_FIELDS, self._NEO4J_GETTER(self)))
+        props["type"] = _REL_VALUES[self.type]
+        props["created_at"] = self.created_at.isoformat()
+        props["updated_at"] = self.updated_at.isoformat()
 
         if self.start_date:
             props["start_date"] = self.start_date.isoformat()
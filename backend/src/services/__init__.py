@@ -2,10 +2,16 @@
 
 from .r2r_service import R2RService
 from .neo4j_service import Neo4jService
-from .vector_service import VectorService
+from .semantic_cache import SemanticCache, cache_key
+from .vector_service import VectorService, EmbeddingCoalescer
+from .reranker_service import RerankerService
 
 __all__ = [
     "R2RService",
     "Neo4jService",
+    "SemanticCache",
     "VectorService",
+    "EmbeddingCoalescer",
+    "RerankerService",
+    "cache_key",
 ]
\ No newline at end of file
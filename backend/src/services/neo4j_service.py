@@ -1,19 +1,160 @@
 """Neo4j graph database service for GraphAura."""
 
-from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Literal, Union
+from async_lru import alru_cache
 from neo4j import AsyncGraphDatabase, AsyncDriver
+import re
 import structlog
 
 from ..config import settings
-from ..models.entities import Entity, EntityFilter
+from ..models.entities import Entity, EntityFilter, EntityType
+from ..models.ingest import EntityMsg, RelationshipMsg
+from .semantic_cache import cache_key
 from ..models.relationships import (
     Relationship,
     RelationshipFilter,
+    RelationType,
     GraphTraversalRequest
 )
 
 logger = structlog.get_logger(__name__)
 
+# Clauses that make a Cypher query mutating
+_WRITE_CYPHER = re.compile(
+    r"\b(?:CREATE|MERGE|SET|DELETE|REMOVE|DETACH|DROP|FOREACH|LOAD\s+CSV)\b",
+    re.IGNORECASE
+)
+
+# apoc.create takes the label / relationship type as a parameter, so a
+# single constant query string covers every enum member and the server
+# plan cache sees one statement instead of one per type. The previous
+# string-concatenated variants also emitted `(e:Entity {props})`, which
+# the server rejects as a literal map rather than a parameter.
+_ENTITY_TYPE_LABELS = {
+    entity_type: entity_type.value.capitalize() for entity_type in EntityType
+}
+
+_REL_TYPE_NAMES = {
+    rel_type: rel_type.value.upper() for rel_type in RelationType
+}
+
+_CREATE_ENTITY_QUERY = """
+CALL apoc.create.node(['Entity', $label], $props)
+YIELD node
+RETURN node.id AS id
+"""
+
+_CREATE_REL_QUERY = """
+MATCH (source:Entity {id: $source_id})
+MATCH (target:Entity {id: $target_id})
+CALL apoc.create.relationship(source, $rel_type, $props, target)
+YIELD rel
+RETURN rel.id AS rel_id
+"""
+
+
+# Characters (and the && / || operators) the Lucene query parser treats
+# as syntax; unescaped user text containing them raises ClientError.
+_LUCENE_SPECIALS = re.compile(r'(&&|\|\||[+\-!(){}\[\]^"~*?:\\/])')
+
+
+def _lucene_escape(text: str) -> str:
+    """Backslash-escape Lucene syntax so user text matches literally."""
+    return _LUCENE_SPECIALS.sub(r"\\\1", text)
+
+
+@lru_cache(maxsize=None)
+def _return_entity(projection: Optional[Tuple[str, ...]]) -> str:
+    """RETURN expression for an entity, always map-projected.
+
+    `e {.*}` makes the server send a plain property map instead of a
+    Node object, so rows arrive as dicts without per-property conversion
+    in Python.
+    """
+    if not projection:
+        return "e {.*}"
+    fields = ", ".join(f".{field}" for field in projection)
+    return f"e {{{fields}}}"
+
+
+@lru_cache(maxsize=None)
+def _get_entity_query(projection: Optional[Tuple[str, ...]]) -> str:
+    return f"""
+    MATCH (e:Entity {{id: $entity_id}})
+    RETURN {_return_entity(projection)} AS e
+    """
+
+
+@lru_cache(maxsize=None)
+def _bulk_entity_query(label: str) -> str:
+    return f"""
+    UNWIND $rows AS row
+    MERGE (e:Entity {{id: row.id}})
+    ON CREATE SET e = row
+    ON MATCH SET e += row
+    SET e:{label}
+    """
+
+
+@lru_cache(maxsize=None)
+def _bulk_relationship_query(rel_type: str) -> str:
+    return f"""
+    UNWIND $rows AS r
+    MATCH (s:Entity {{id: r.src}})
+    MATCH (t:Entity {{id: r.tgt}})
+    MERGE (s)-[x:{rel_type} {{id: r.props.id}}]->(t)
+    ON CREATE SET x = r.props
+    ON MATCH SET x += r.props
+    """
+
+
+@lru_cache(maxsize=None)
+def _shortest_path_query(rel_types: Tuple[str, ...], max_depth: int) -> str:
+    """Build (and memoize) the shortest-path query for one request shape."""
+    rel_filter = f":{'|'.join(rel_types)}" if rel_types else ""
+
+    # Nodes and edges are shaped into plain maps server-side (a path in
+    # shortestPath never repeats a node, so no client dedup is needed);
+    # the client receives one ready-to-return row.
+    return f"""
+    MATCH path = shortestPath(
+        (start:Entity {{id: $start_id}})-
+        [r{rel_filter}*..{max_depth}]-
+        (end:Entity {{id: $target_id}})
+    )
+    WHERE all(rel IN relationships(path)
+             WHERE rel.confidence_score >= $min_confidence)
+    RETURN [n IN nodes(path) | properties(n)] AS nodes,
+           [rel IN relationships(path)
+            | {{source: startNode(rel).id, target: endNode(rel).id,
+               type: type(rel), properties: properties(rel)}}] AS edges
+    LIMIT 1
+    """
+
+
+# apoc.path.subgraphAll expands breadth-first server-side and yields the
+# deduplicated node and relationship sets directly, instead of
+# materializing every path for a variable-length pattern only for the
+# client to collapse them back down. Every knob is a parameter, so the
+# query text (and its server-side plan) is a single constant.
+_SUBGRAPH_QUERY = """
+MATCH (start:Entity {id: $start_id})
+CALL apoc.path.subgraphAll(start, {
+    relationshipFilter: $rel_filter,
+    maxLevel: $max_depth,
+    bfs: true,
+    limit: $limit
+})
+YIELD nodes, relationships
+RETURN [n IN nodes | properties(n)] AS nodes,
+       [r IN relationships
+        WHERE coalesce(r.confidence_score, 1.0) >= $min_confidence
+        | {source: startNode(r).id, target: endNode(r).id,
+           type: type(r), properties: properties(r)}] AS edges
+"""
+
 
 class Neo4jService:
     """Service for Neo4j graph database operations."""
@@ -24,6 +165,7 @@ class Neo4jService:
         self.auth = (settings.neo4j_user, settings.neo4j_password)
         self.database = settings.neo4j_database
         self.driver: Optional[AsyncDriver] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     async def connect(self):
         """Connect to Neo4j database."""
@@ -31,7 +173,10 @@ class Neo4jService:
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
                 auth=self.auth,
-                max_connection_lifetime=3600
+                max_connection_lifetime=3600,
+                max_connection_pool_size=settings.neo4j_pool_size,
+                connection_acquisition_timeout=settings.neo4j_acquire_timeout,
+                keep_alive=True
             )
             await self.driver.verify_connectivity()
             logger.info("Connected to Neo4j", uri=self.uri)
@@ -54,6 +199,64 @@ class Neo4jService:
         """Async context manager exit."""
         await self.disconnect()
 
+    # Managed transactions (execute_read/execute_write) instead of
+    # session.run: the driver retries transient failures, read work is
+    # routable to replicas, and the server keeps its query-plan cache
+    # warm per transaction function. Sessions themselves stay per-call —
+    # they are cheap wrappers over the driver's connection pool.
+
+    def _invalidate_graph_caches(self):
+        """Drop cached traversals and relationship lists after graph writes."""
+        self._traverse.cache_clear()
+        self.get_entity_relationships.cache_clear()
+
+    async def _execute_read(self, work):
+        """Run a transaction function in a managed read transaction."""
+        # A large fetch size keeps the driver pulling Bolt frames in the
+        # background while Python is still materializing earlier rows.
+        async with self.driver.session(
+            database=self.database,
+            fetch_size=settings.neo4j_fetch_size
+        ) as session:
+            return await session.execute_read(work)
+
+    async def _execute_write(self, work):
+        """Run a transaction function in a managed write transaction."""
+        async with self.driver.session(database=self.database) as session:
+            return await session.execute_write(work)
+
+    async def _singleflight_read(self, key: str, work):
+        """
+        Run a read, collapsing concurrent identical calls into one query.
+
+        Under load (a polling graph UI, fan-in from bulk endpoints) many
+        coroutines can issue the same read before the first response
+        returns. The first caller per key runs the query; the rest await
+        its future. Unlike the TTL caches this holds no completed
+        results — the entry lives only while the query is in flight.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._execute_read(work)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Mark retrieved so lone flights don't log a warning.
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
     async def create_entity(self, entity: Entity) -> str:
         """
         Create an entity node in Neo4j.
@@ -64,22 +267,191 @@ class Neo4jService:
         Returns:
             Entity ID
         """
-        async with self.driver.session(database=self.database) as session:
-            query = """
-            CREATE (e:Entity {props})
-            SET e:""" + entity.type.value.capitalize() + """
-            RETURN e.id as id
-            """
-
-            result = await session.run(
-                query,
+        async def work(tx):
+            result = await tx.run(
+                _CREATE_ENTITY_QUERY,
+                label=_ENTITY_TYPE_LABELS[entity.type],
                 props=entity.to_neo4j()
             )
             record = await result.single()
-
-            logger.info("Entity created", entity_id=entity.id, type=entity.type)
             return record["id"]
 
+        entity_id = await self._execute_write(work)
+        logger.info("Entity created", entity_id=entity.id, type=entity.type)
+        return entity_id
+
+    async def create_entities_bulk(
+        self,
+        entities: List[Union[Entity, EntityMsg]],
+        batch_size: int = 1000
+    ) -> List[str]:
+        """
+        Upsert many entity nodes with batched UNWIND writes.
+
+        Entities are grouped per type label and written as one
+        `UNWIND ... MERGE` statement per batch, so the commit and Bolt
+        round-trip costs are amortized across the batch instead of paid
+        once per entity. MERGE on id makes re-ingestion idempotent:
+        callers no longer pre-check existence with extra queries, and
+        duplicate rows update in place instead of duplicating nodes.
+
+        Trusted internal callers (extraction pipelines, importers) can
+        pass EntityMsg structs decoded via `models.ingest` to skip
+        pydantic validation on the bulk path.
+
+        Args:
+            entities: Entities to upsert
+            batch_size: Maximum rows per transaction
+
+        Returns:
+            Upserted entity IDs
+        """
+        if not entities:
+            return []
+
+        buckets: Dict[str, List[Dict[str, Any]]] = {}
+        for entity in entities:
+            label = _ENTITY_TYPE_LABELS[entity.type]
+            buckets.setdefault(label, []).append(entity.to_neo4j())
+
+        async with self.driver.session(database=self.database) as session:
+            for label, rows in buckets.items():
+                query = _bulk_entity_query(label)
+
+                for start in range(0, len(rows), batch_size):
+                    chunk = rows[start:start + batch_size]
+                    tx = await session.begin_transaction()
+                    try:
+                        await tx.run(query, rows=chunk)
+                        await tx.commit()
+                    finally:
+                        await tx.close()
+
+        for entity in entities:
+            self.get_entity.cache_invalidate(entity.id)
+        self._invalidate_graph_caches()
+
+        logger.info("Entities bulk upserted", count=len(entities))
+        return [entity.id for entity in entities]
+
+    async def create_relationships_bulk(
+        self,
+        relationships: List[Union[Relationship, RelationshipMsg]],
+        batch_size: int = 1000
+    ) -> List[str]:
+        """
+        Upsert many relationships with batched UNWIND writes.
+
+        Relationships are grouped per type and written as one
+        `UNWIND ... MATCH ... MERGE` statement per batch, mirroring
+        create_entities_bulk: MERGE on the relationship id makes
+        re-ingestion idempotent. RelationshipMsg structs are accepted
+        alongside validated models, as in create_entities_bulk.
+
+        Args:
+            relationships: Relationships to upsert
+            batch_size: Maximum rows per transaction
+
+        Returns:
+            Upserted relationship IDs
+        """
+        if not relationships:
+            return []
+
+        buckets: Dict[str, List[Dict[str, Any]]] = {}
+        for relationship in relationships:
+            rel_type = _REL_TYPE_NAMES[relationship.type]
+            buckets.setdefault(rel_type, []).append({
+                "src": relationship.source_id,
+                "tgt": relationship.target_id,
+                "props": relationship.to_neo4j()
+            })
+
+        async with self.driver.session(database=self.database) as session:
+            for rel_type, rows in buckets.items():
+                query = _bulk_relationship_query(rel_type)
+
+                for start in range(0, len(rows), batch_size):
+                    chunk = rows[start:start + batch_size]
+                    tx = await session.begin_transaction()
+                    try:
+                        await tx.run(query, rows=chunk)
+                        await tx.commit()
+                    finally:
+                        await tx.close()
+
+        for relationship in relationships:
+            self.get_entity.cache_invalidate(relationship.source_id)
+            self.get_entity.cache_invalidate(relationship.target_id)
+        self._invalidate_graph_caches()
+
+        logger.info("Relationships bulk upserted", count=len(relationships))
+        return [relationship.id for relationship in relationships]
+
+    async def write_subgraph(
+        self,
+        entities: List[Union[Entity, EntityMsg]],
+        relationships: List[Union[Relationship, RelationshipMsg]]
+    ) -> Dict[str, int]:
+        """
+        Upsert a set of entities and their relationships in one transaction.
+
+        Import callers previously created each node and then each edge as
+        its own transaction; here the whole subgraph shares one commit —
+        one UNWIND statement per entity label, then one per relationship
+        type, all inside a single explicit transaction, so nodes and the
+        edges that reference them land atomically. msgspec structs from
+        `models.ingest` are accepted alongside the validated models.
+
+        Args:
+            entities: Entities to upsert
+            relationships: Relationships between them to upsert
+
+        Returns:
+            Counts of written entities and relationships
+        """
+        if not entities and not relationships:
+            return {"entities": 0, "relationships": 0}
+
+        entity_buckets: Dict[str, List[Dict[str, Any]]] = {}
+        for entity in entities:
+            label = _ENTITY_TYPE_LABELS[entity.type]
+            entity_buckets.setdefault(label, []).append(entity.to_neo4j())
+
+        rel_buckets: Dict[str, List[Dict[str, Any]]] = {}
+        for relationship in relationships:
+            rel_type = _REL_TYPE_NAMES[relationship.type]
+            rel_buckets.setdefault(rel_type, []).append({
+                "src": relationship.source_id,
+                "tgt": relationship.target_id,
+                "props": relationship.to_neo4j()
+            })
+
+        async with self.driver.session(database=self.database) as session:
+            tx = await session.begin_transaction()
+            try:
+                for label, rows in entity_buckets.items():
+                    await tx.run(_bulk_entity_query(label), rows=rows)
+                for rel_type, rows in rel_buckets.items():
+                    await tx.run(_bulk_relationship_query(rel_type), rows=rows)
+                await tx.commit()
+            finally:
+                await tx.close()
+
+        for entity in entities:
+            self.get_entity.cache_invalidate(entity.id)
+        self._invalidate_graph_caches()
+
+        logger.info(
+            "Subgraph written",
+            entities=len(entities),
+            relationships=len(relationships)
+        )
+        return {
+            "entities": len(entities),
+            "relationships": len(relationships)
+        }
+
     async def update_entity(self, entity_id: str, updates: Dict[str, Any]) -> bool:
         """
         Update an entity in Neo4j.
@@ -91,48 +463,87 @@ class Neo4jService:
         Returns:
             True if update was successful
         """
-        async with self.driver.session(database=self.database) as session:
-            query = """
-            MATCH (e:Entity {id: $entity_id})
-            SET e += $updates
-            SET e.updated_at = datetime()
-            RETURN e.id as id
-            """
+        query = """
+        MATCH (e:Entity {id: $entity_id})
+        SET e += $updates
+        SET e.updated_at = datetime()
+        RETURN e.id as id
+        """
 
-            result = await session.run(
-                query,
-                entity_id=entity_id,
-                updates=updates
-            )
-            record = await result.single()
+        async def work(tx):
+            result = await tx.run(query, entity_id=entity_id, updates=updates)
+            return await result.single()
 
-            if record:
-                logger.info("Entity updated", entity_id=entity_id)
-                return True
-            return False
+        record = await self._execute_write(work)
+
+        if record:
+            self.get_entity.cache_invalidate(entity_id)
+            self._invalidate_graph_caches()
+            logger.info("Entity updated", entity_id=entity_id)
+            return True
+        return False
 
-    async def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
+    @alru_cache(maxsize=10_000, ttl=60)
+    async def get_entity(
+        self,
+        entity_id: str,
+        projection: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get an entity from Neo4j.
 
+        Results are cached for 60s; writes invalidate the cached entry
+        (projected variants age out by TTL). Passing a projection tuple
+        map-projects server-side so only the named properties cross the
+        wire.
+
         Args:
             entity_id: Entity ID
+            projection: Optional property names to return
 
         Returns:
             Entity data or None if not found
         """
-        async with self.driver.session(database=self.database) as session:
-            query = """
-            MATCH (e:Entity {id: $entity_id})
-            RETURN e
-            """
+        query = _get_entity_query(projection)
 
-            result = await session.run(query, entity_id=entity_id)
+        async def work(tx):
+            result = await tx.run(query, entity_id=entity_id)
             record = await result.single()
+            return record["e"] if record else None
 
-            if record:
-                return dict(record["e"])
-            return None
+        return await self._execute_read(work)
+
+    async def get_entities_by_ids(
+        self,
+        entity_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get multiple entities in a single query.
+
+        Args:
+            entity_ids: Entity IDs to fetch
+
+        Returns:
+            Mapping of entity ID to entity data
+        """
+        if not entity_ids:
+            return {}
+
+        query = """
+        UNWIND $entity_ids AS entity_id
+        MATCH (e:Entity {id: entity_id})
+        RETURN e.id as id, e {.*} AS e
+        """
+
+        async def work(tx):
+            result = await tx.run(query, entity_ids=entity_ids)
+            # result.data() materializes rows to plain dicts inside the
+            # driver instead of per-record Python-level conversion.
+            return {
+                row["id"]: row["e"] for row in await result.data("id", "e")
+            }
+
+        return await self._singleflight_read(cache_key(query, entity_ids), work)
 
     async def delete_entity(self, entity_id: str) -> bool:
         """
@@ -144,20 +555,23 @@ class Neo4jService:
         Returns:
             True if deletion was successful
         """
-        async with self.driver.session(database=self.database) as session:
-            query = """
-            MATCH (e:Entity {id: $entity_id})
-            DETACH DELETE e
-            RETURN count(e) as deleted
-            """
+        query = """
+        MATCH (e:Entity {id: $entity_id})
+        DETACH DELETE e
+        RETURN count(e) as deleted
+        """
 
-            result = await session.run(query, entity_id=entity_id)
+        async def work(tx):
+            result = await tx.run(query, entity_id=entity_id)
             record = await result.single()
+            return record["deleted"]
 
-            if record["deleted"] > 0:
-                logger.info("Entity deleted", entity_id=entity_id)
-                return True
-            return False
+        if await self._execute_write(work) > 0:
+            self.get_entity.cache_invalidate(entity_id)
+            self._invalidate_graph_caches()
+            logger.info("Entity deleted", entity_id=entity_id)
+            return True
+        return False
 
     async def create_relationship(self, relationship: Relationship) -> str:
         """
@@ -169,84 +583,303 @@ class Neo4jService:
         Returns:
             Relationship ID
         """
-        async with self.driver.session(database=self.database) as session:
-            query = f"""
-            MATCH (source:Entity {{id: $source_id}})
-            MATCH (target:Entity {{id: $target_id}})
-            CREATE (source)-[r:{relationship.type.value.upper()} $props]->(target)
-            RETURN id(r) as rel_id
-            """
-
-            result = await session.run(
-                query,
+        async def work(tx):
+            result = await tx.run(
+                _CREATE_REL_QUERY,
                 source_id=relationship.source_id,
                 target_id=relationship.target_id,
+                rel_type=_REL_TYPE_NAMES[relationship.type],
                 props=relationship.to_neo4j()
             )
-            record = await result.single()
-
-            if record:
-                logger.info(
-                    "Relationship created",
-                    relationship_id=relationship.id,
-                    type=relationship.type
+            return await result.single()
+
+        record = await self._execute_write(work)
+
+        if record:
+            self.get_entity.cache_invalidate(relationship.source_id)
+            self.get_entity.cache_invalidate(relationship.target_id)
+            self._invalidate_graph_caches()
+            logger.info(
+                "Relationship created",
+                relationship_id=relationship.id,
+                type=relationship.type
+            )
+            return relationship.id
+        raise ValueError("Failed to create relationship")
+
+    @staticmethod
+    def _entity_where_clause(
+        filter: Optional[EntityFilter],
+        params: Dict[str, Any],
+        skip_tags: bool = False
+    ) -> str:
+        """Build the WHERE clause for an entity filter, updating params."""
+        where_clauses = []
+
+        if filter:
+            if filter.types:
+                type_labels = [t.value.capitalize() for t in filter.types]
+                where_clauses.append(
+                    f"any(label in labels(e) WHERE label IN {type_labels})"
                 )
-                return relationship.id
-            raise ValueError("Failed to create relationship")
+
+            if filter.tags and not skip_tags:
+                where_clauses.append("any(tag IN $tags WHERE tag IN e.tags)")
+                params["tags"] = filter.tags
+
+            if filter.min_confidence is not None:
+                where_clauses.append("e.confidence_score >= $min_confidence")
+                params["min_confidence"] = filter.min_confidence
+
+        return " AND ".join(where_clauses) if where_clauses else "1=1"
 
     async def find_entities(
         self,
         filter: Optional[EntityFilter] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        projection: Optional[List[str]] = None,
+        after: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Find entities matching filter criteria.
 
+        Pagination prefers the keyset cursor: pass the previous page's
+        last created_at as `after` and the query range-scans the index
+        instead of re-reading and discarding `offset` rows per page.
+        `offset` remains for legacy callers and is ignored when `after`
+        is given.
+
         Args:
             filter: Entity filter criteria
             limit: Maximum number of results
-            offset: Result offset
+            offset: Result offset (legacy; superseded by after)
+            projection: Optional property names to return per entity
+            after: Keyset cursor — ISO created_at of the previous page's
+                last entity
 
         Returns:
             List of matching entities
         """
-        async with self.driver.session(database=self.database) as session:
-            where_clauses = []
-            params = {"limit": limit, "offset": offset}
-
-            if filter:
-                if filter.types:
-                    type_labels = [t.value.capitalize() for t in filter.types]
-                    where_clauses.append(
-                        f"any(label in labels(e) WHERE label IN {type_labels})"
-                    )
-
-                if filter.tags:
-                    where_clauses.append("any(tag IN $tags WHERE tag IN e.tags)")
-                    params["tags"] = filter.tags
-
-                if filter.min_confidence is not None:
-                    where_clauses.append("e.confidence_score >= $min_confidence")
-                    params["min_confidence"] = filter.min_confidence
-
-            where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
-
-            query = f"""
-            MATCH (e:Entity)
-            WHERE {where_clause}
-            RETURN e
-            ORDER BY e.created_at DESC
-            SKIP $offset
-            LIMIT $limit
-            """
+        params = {"limit": limit, "offset": offset}
+        use_tag_index = bool(filter and filter.tags)
+        where_clause = self._entity_where_clause(
+            filter, params, skip_tags=use_tag_index
+        )
+        return_expr = _return_entity(tuple(projection) if projection else None)
+
+        # Tag filters seed the match from the entity_tags fulltext index
+        # instead of label-scanning Entity and testing each tag list.
+        if use_tag_index:
+            match_clause = """
+            CALL db.index.fulltext.queryNodes('entity_tags', $tag_query)
+            YIELD node
+            WITH node AS e"""
+            # Each tag is quoted as a Lucene phrase so multi-word tags
+            # stay one term and embedded operators match literally.
+            params["tag_query"] = " OR ".join(
+                f'"{_lucene_escape(tag)}"' for tag in filter.tags
+            )
+        else:
+            match_clause = "MATCH (e:Entity)"
+
+        if after is not None:
+            # created_at is stored as ISO-8601 text, which compares
+            # lexicographically in timestamp order.
+            where_clause = f"({where_clause}) AND e.created_at < $after"
+            params["after"] = after
+            skip_clause = ""
+        else:
+            skip_clause = "SKIP $offset"
+
+        # Ordering happens on the node before the map projection so the
+        # sort key need not be part of the projected fields.
+        query = f"""
+        {match_clause}
+        WHERE {where_clause}
+        WITH e
+        ORDER BY e.created_at DESC
+        {skip_clause}
+        LIMIT $limit
+        RETURN {return_expr} AS e
+        """
+
+        async def work(tx):
+            result = await tx.run(query, **params)
+            return [row["e"] for row in await result.data("e")]
+
+        return await self._singleflight_read(cache_key(query, params), work)
+
+    async def stream_entities(
+        self,
+        filter: Optional[EntityFilter] = None,
+        projection: Optional[List[str]] = None
+    ):
+        """
+        Stream matching entities incrementally.
+
+        Unlike find_entities this yields rows as the driver fetches
+        them, so callers exporting or reprocessing a large slice of the
+        graph never hold the full result in memory. Records arrive in
+        fetch_size batches that the driver pulls while the caller is
+        still processing earlier rows.
+
+        Args:
+            filter: Entity filter criteria
+            projection: Optional property names to return per entity
+
+        Yields:
+            Matching entities, newest first
+        """
+        params: Dict[str, Any] = {}
+        where_clause = self._entity_where_clause(filter, params)
+        return_expr = _return_entity(tuple(projection) if projection else None)
+
+        query = f"""
+        MATCH (e:Entity)
+        WHERE {where_clause}
+        WITH e
+        ORDER BY e.created_at DESC
+        RETURN {return_expr} AS e
+        """
 
+        async with self.driver.session(
+            database=self.database,
+            fetch_size=settings.neo4j_fetch_size
+        ) as session:
             result = await session.run(query, **params)
-            entities = []
             async for record in result:
-                entities.append(dict(record["e"]))
+                yield record["e"]
 
-            return entities
+    async def search_entities(
+        self,
+        query: str,
+        types: Optional[List[str]] = None,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over entity names and descriptions.
+
+        Uses the `entity_search` fulltext index so matching happens inside
+        Neo4j and only `limit` rows cross the wire.
+
+        Args:
+            query: Search text
+            types: Optional entity type filter
+            limit: Maximum number of results
+
+        Returns:
+            List of matching entities with a `score` field
+        """
+        # Escaped so queries containing Lucene syntax (quotes, parens,
+        # ~, ^, wildcards) match literally instead of raising ClientError.
+        search_text = _lucene_escape(query.strip())
+        if not search_text:
+            return []
+
+        cypher = """
+        CALL db.index.fulltext.queryNodes('entity_search', $query)
+        YIELD node, score
+        WHERE $types IS NULL OR node.type IN $types
+        RETURN node {.*, score: score} AS node
+        LIMIT $limit
+        """
+
+        async def work(tx):
+            result = await tx.run(
+                cypher, query=search_text, types=types, limit=limit
+            )
+            return [row["node"] for row in await result.data("node")]
+
+        return await self._singleflight_read(
+            cache_key(query, [types, limit]), work
+        )
+
+    @alru_cache(maxsize=1024, ttl=5)
+    async def suggest(
+        self,
+        prefix: str,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Autocomplete entity names for a partial query.
+
+        Runs a wildcard query against the `entity_search` fulltext index
+        so suggestions come back ranked and indexed rather than scanned.
+        Results are cached for 5s since autocomplete re-issues the same
+        prefixes keystroke by keystroke.
+
+        Args:
+            prefix: Partial search text
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of suggestions with text, type and entity_id
+        """
+        # Mid-keystroke input routinely contains Lucene syntax ("c++",
+        # "(", ":"); escape it so the parser sees a literal prefix, and
+        # skip blank input that would otherwise become a bare "*" term.
+        term = _lucene_escape(prefix.strip())
+        if not term:
+            return []
+
+        cypher = """
+        CALL db.index.fulltext.queryNodes('entity_search', $query)
+        YIELD node, score
+        RETURN node.name as text,
+               coalesce(node.type, 'unknown') as type,
+               node.id as entity_id
+        LIMIT $limit
+        """
+
+        async def work(tx):
+            result = await tx.run(cypher, query=f"{term}*", limit=limit)
+            return await result.data("text", "type", "entity_id")
+
+        return await self._execute_read(work)
+
+    async def find_visualization_nodes(
+        self,
+        filter: Optional[EntityFilter] = None,
+        limit: int = 100,
+        show_properties: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Find matching entities shaped as visualization node maps.
+
+        The {id, label, type, properties} projection is built server-side
+        so the driver hands back ready-to-serialize maps.
+
+        Args:
+            filter: Entity filter criteria
+            limit: Maximum number of nodes
+            show_properties: Include full node properties in the projection
+
+        Returns:
+            List of node maps
+        """
+        params = {"limit": limit, "show_properties": show_properties}
+        where_clause = self._entity_where_clause(filter, params)
+
+        query = f"""
+        MATCH (e:Entity)
+        WHERE {where_clause}
+        RETURN {{
+            id: e.id,
+            label: coalesce(e.name, e.id),
+            type: coalesce(e.type, 'unknown'),
+            properties: CASE WHEN $show_properties
+                        THEN properties(e) ELSE {{}} END
+        }} as node
+        ORDER BY e.created_at DESC
+        LIMIT $limit
+        """
+
+        async def work(tx):
+            result = await tx.run(query, **params)
+            return [row["node"] for row in await result.data("node")]
+
+        return await self._singleflight_read(cache_key(query, params), work)
 
     async def traverse_graph(
         self,
@@ -261,90 +894,133 @@ class Neo4jService:
         Returns:
             Traversal results with nodes and edges
         """
-        async with self.driver.session(database=self.database) as session:
-            rel_filter = ""
-            if request.relationship_types:
-                rel_types = [r.value.upper() for r in request.relationship_types]
-                rel_filter = f":{"|".join(rel_types)}"
-
-            direction = "*" if request.bidirectional else ">"
-
-            if request.find_shortest_path and request.target_entity_id:
-                query = f"""
-                MATCH path = shortestPath(
-                    (start:Entity {{id: $start_id}})-
-                    [r{rel_filter}*..{request.max_depth}]-
-                    (end:Entity {{id: $target_id}})
-                )
-                WHERE all(rel IN relationships(path)
-                         WHERE rel.confidence_score >= $min_confidence)
-                RETURN path
-                LIMIT 1
-                """
-                params = {
-                    "start_id": request.start_entity_id,
-                    "target_id": request.target_entity_id,
-                    "min_confidence": request.min_confidence
-                }
-            else:
-                query = f"""
-                MATCH path = (start:Entity {{id: $start_id}})-
-                      [r{rel_filter}*1..{request.max_depth}]-{direction}
-                      (connected:Entity)
-                WHERE all(rel IN relationships(path)
-                         WHERE rel.confidence_score >= $min_confidence)
-                RETURN DISTINCT connected, relationships(path) as rels
-                LIMIT $limit
-                """
-                params = {
-                    "start_id": request.start_entity_id,
-                    "min_confidence": request.min_confidence,
-                    "limit": request.limit
-                }
+        rel_types = tuple(
+            r.value.upper() for r in request.relationship_types or ()
+        )
+        shortest = bool(
+            request.find_shortest_path and request.target_entity_id
+        )
+
+        nodes, edges = await self._traverse(
+            request.start_entity_id,
+            request.target_entity_id if shortest else None,
+            rel_types,
+            request.bidirectional,
+            shortest,
+            request.max_depth,
+            request.min_confidence,
+            request.limit
+        )
+
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "node_count": len(nodes),
+            "edge_count": len(edges)
+        }
+
+    @alru_cache(maxsize=2048, ttl=60)
+    async def _traverse(
+        self,
+        start_id: str,
+        target_id: Optional[str],
+        rel_types: Tuple[str, ...],
+        bidirectional: bool,
+        shortest: bool,
+        max_depth: int,
+        min_confidence: float,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run one traversal, cached for 60s per request shape.
 
-            result = await session.run(query, **params)
+        Traversal workloads revisit the same start vertices; caching on
+        the scalar request tuple skips the round-trip and expansion for
+        repeats. Graph writes clear this cache.
+        """
+        if shortest:
+            query = _shortest_path_query(rel_types, max_depth)
+            params = {
+                "start_id": start_id,
+                "target_id": target_id,
+                "min_confidence": min_confidence
+            }
+        else:
+            # APOC relationship filter: "TYPE" both ways, "TYPE>" outgoing.
+            suffix = "" if bidirectional else ">"
+            rel_filter = (
+                "|".join(t + suffix for t in rel_types)
+                if rel_types else suffix
+            )
+            query = _SUBGRAPH_QUERY
+            params = {
+                "start_id": start_id,
+                "rel_filter": rel_filter,
+                "max_depth": max_depth,
+                "limit": limit,
+                "min_confidence": min_confidence
+            }
 
-            nodes = []
-            edges = []
-            node_ids = set()
+        async def work(tx):
+            result = await tx.run(query, **params)
 
-            async for record in result:
-                if "path" in record:
-                    # Process shortest path
-                    path = record["path"]
-                    for node in path.nodes:
-                        if node["id"] not in node_ids:
-                            nodes.append(dict(node))
-                            node_ids.add(node["id"])
-                    for rel in path.relationships:
-                        edges.append({
-                            "source": rel.start_node["id"],
-                            "target": rel.end_node["id"],
-                            "type": rel.type,
-                            "properties": dict(rel)
-                        })
-                else:
-                    # Process general traversal
-                    node = dict(record["connected"])
-                    if node["id"] not in node_ids:
-                        nodes.append(node)
-                        node_ids.add(node["id"])
-
-                    for rel in record["rels"]:
-                        edges.append({
-                            "source": rel.start_node["id"],
-                            "target": rel.end_node["id"],
-                            "type": rel.type,
-                            "properties": dict(rel)
-                        })
+            # Both queries dedup and shape node/edge maps server-side,
+            # so a single row comes back ready to return — no path
+            # objects to walk in Python.
+            record = await result.single()
+            if record:
+                return record["nodes"], record["edges"]
+            return [], []
+
+        return await self._execute_read(work)
 
+    async def traverse_graph_bulk(
+        self,
+        start_ids: List[str],
+        max_depth: int = 2,
+        limit_per: int = 20,
+        min_confidence: float = 0.0
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Traverse the graph from several starting entities in one query.
+
+        Args:
+            start_ids: Entity IDs to start from
+            max_depth: Maximum traversal depth
+            limit_per: Maximum connected nodes per start entity
+            min_confidence: Minimum relationship confidence
+
+        Returns:
+            Mapping of start entity ID to its connected nodes
+        """
+        if not start_ids:
+            return {}
+
+        query = f"""
+        UNWIND $start_ids AS start_id
+        MATCH path = (start:Entity {{id: start_id}})-
+              [r*1..{max_depth}]-(connected:Entity)
+        WHERE all(rel IN relationships(path)
+                 WHERE rel.confidence_score >= $min_confidence)
+        WITH start_id, collect(DISTINCT connected)[..$limit_per] as connected
+        RETURN start_id, [n IN connected | n {{.*}}] AS connected
+        """
+
+        async def work(tx):
+            result = await tx.run(
+                query,
+                start_ids=start_ids,
+                min_confidence=min_confidence,
+                limit_per=limit_per
+            )
             return {
-                "nodes": nodes,
-                "edges": edges,
-                "node_count": len(nodes),
-                "edge_count": len(edges)
+                row["start_id"]: row["connected"]
+                for row in await result.data("start_id", "connected")
             }
 
+        return await self._execute_read(work)
+
+    @alru_cache(maxsize=4096, ttl=30)
     async def get_entity_relationships(
         self,
         entity_id: str,
@@ -353,6 +1029,8 @@ class Neo4jService:
         """
         Get all relationships for an entity.
 
+        Results are cached for 30s; graph writes clear the cache.
+
         Args:
             entity_id: Entity ID
             direction: Relationship direction (in, out, both)
@@ -360,81 +1038,175 @@ class Neo4jService:
         Returns:
             List of relationships
         """
-        async with self.driver.session(database=self.database) as session:
-            if direction == "out":
-                query = """
-                MATCH (e:Entity {id: $entity_id})-[r]->(target:Entity)
-                RETURN r, target
-                """
-            elif direction == "in":
-                query = """
-                MATCH (source:Entity)-[r]->(e:Entity {id: $entity_id})
-                RETURN r, source
-                """
-            else:
-                query = """
-                MATCH (e:Entity {id: $entity_id})-[r]-(other:Entity)
-                RETURN r, other,
-                       CASE WHEN startNode(r) = e THEN 'out' ELSE 'in' END as direction
-                """
+        if direction == "out":
+            query = """
+            MATCH (e:Entity {id: $entity_id})-[r]->(target:Entity)
+            RETURN r {.*} AS rel, target {.*} AS target
+            """
+        elif direction == "in":
+            query = """
+            MATCH (source:Entity)-[r]->(e:Entity {id: $entity_id})
+            RETURN r {.*} AS rel, source {.*} AS source
+            """
+        else:
+            query = """
+            MATCH (e:Entity {id: $entity_id})-[r]-(other:Entity)
+            RETURN r {.*} AS rel, other {.*} AS other,
+                   CASE WHEN startNode(r) = e THEN 'out' ELSE 'in' END as direction
+            """
 
-            result = await session.run(query, entity_id=entity_id)
+        async def work(tx):
+            result = await tx.run(query, entity_id=entity_id)
             relationships = []
 
-            async for record in result:
-                rel_data = dict(record["r"])
-                if "direction" in record:
-                    rel_data["direction"] = record["direction"]
-
-                if "target" in record:
-                    rel_data["target"] = dict(record["target"])
-                elif "source" in record:
-                    rel_data["source"] = dict(record["source"])
-                else:
-                    rel_data["other"] = dict(record["other"])
-
+            # Rows arrive as plain maps; fold the endpoint (and the
+            # direction marker in the bidirectional case) into the
+            # relationship dict.
+            for row in await result.data():
+                rel_data = row.pop("rel")
+                rel_data.update(row)
                 relationships.append(rel_data)
 
             return relationships
 
+        return await self._execute_read(work)
+
+    async def get_entity_relationships_bulk(
+        self,
+        entity_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get relationships for many entities in one round-trip.
+
+        Each relationship map carries the properties plus its type and a
+        slim {id, name, type} projection of the other endpoint, shaped
+        server-side. Callers rendering a graph panel make one call here
+        instead of one get_entity_relationships per node.
+
+        Args:
+            entity_ids: Entity IDs to fetch relationships for
+
+        Returns:
+            Mapping of entity ID to its relationships (empty list when
+            an entity has none)
+        """
+        if not entity_ids:
+            return {}
+
+        query = """
+        UNWIND $entity_ids AS entity_id
+        MATCH (e:Entity {id: entity_id})-[r]-(o:Entity)
+        RETURN entity_id,
+               collect({rel: r {.*, type: type(r)},
+                       other: o {.id, .name, .type}}) AS rels
+        """
+
+        async def work(tx):
+            result = await tx.run(query, entity_ids=entity_ids)
+            return {
+                row["entity_id"]: row["rels"]
+                for row in await result.data("entity_id", "rels")
+            }
+
+        found = await self._execute_read(work)
+        # Entities without relationships produce no row; fill them in.
+        return {entity_id: found.get(entity_id, []) for entity_id in entity_ids}
+
+    async def get_subgraph_edges(
+        self,
+        node_ids: List[str],
+        max_edges: int = 200
+    ) -> List[Dict[str, Any]]:
+        """
+        Get relationships between a set of nodes in a single query.
+
+        Args:
+            node_ids: Entity IDs bounding the subgraph
+            max_edges: Maximum number of edges to return
+
+        Returns:
+            List of edges with source, target, type and weight
+        """
+        if not node_ids:
+            return []
+
+        # Directed match so each relationship yields exactly one row;
+        # the undirected form emitted every edge twice with source and
+        # target swapped, which DISTINCT cannot collapse.
+        query = """
+        MATCH (a:Entity)-[r]->(b:Entity)
+        WHERE a.id IN $node_ids AND b.id IN $node_ids
+        RETURN DISTINCT a.id as source, b.id as target,
+               type(r) as type, coalesce(r.weight, 1.0) as weight
+        ORDER BY weight DESC
+        LIMIT $max_edges
+        """
+
+        async def work(tx):
+            result = await tx.run(query, node_ids=node_ids, max_edges=max_edges)
+            return await result.data()
+
+        return await self._execute_read(work)
+
     async def execute_cypher(
         self,
         query: str,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        *,
+        mode: Literal["read", "write", "auto"] = "auto"
     ) -> List[Dict[str, Any]]:
         """
         Execute a raw Cypher query.
 
+        Read queries run in a read transaction so the server can route them
+        to read replicas and enforce read-onliness at the database level.
+
         Args:
             query: Cypher query
             parameters: Query parameters
+            mode: "read", "write", or "auto" to classify from the query text
 
         Returns:
             Query results
         """
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(query, parameters or {})
-            records = []
-            async for record in result:
-                records.append(dict(record))
-            return records
+        if mode == "auto":
+            mode = "write" if _WRITE_CYPHER.search(query) else "read"
+
+        async def work(tx):
+            result = await tx.run(query, parameters or {})
+            return await result.data()
+
+        if mode == "read":
+            return await self._execute_read(work)
+        return await self._execute_write(work)
 
     async def create_indices(self):
         """Create database indices for performance."""
-        async with self.driver.session(database=self.database) as session:
-            indices = [
-                "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.id)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.type)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.name)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.created_at)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Person) ON (e.id)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Event) ON (e.id)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Location) ON (e.id)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Organization) ON (e.id)",
-                "CREATE INDEX IF NOT EXISTS FOR (e:Document) ON (e.id)"
-            ]
-
-            for index_query in indices:
+        indices = [
+            "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.id)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.type)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.name)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.created_at)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Person) ON (e.id)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Event) ON (e.id)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Location) ON (e.id)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Organization) ON (e.id)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Document) ON (e.id)",
+            # Composite range index backing confidence/recency filters,
+            # and a fulltext index so tag filters seek instead of
+            # scanning every Entity row's tag list.
+            "CREATE INDEX entity_conf_created IF NOT EXISTS "
+            "FOR (e:Entity) ON (e.confidence_score, e.created_at)",
+            "CREATE FULLTEXT INDEX entity_tags IF NOT EXISTS "
+            "FOR (e:Entity) ON EACH [e.tags]"
+        ]
+
+        # Sessions run one statement at a time, so each DDL statement
+        # gets its own session and they all overlap their round-trips.
+        async def run_index(index_query: str):
+            async with self.driver.session(database=self.database) as session:
                 await session.run(index_query)
 
-            logger.info("Neo4j indices created")
\ No newline at end of file
+        await asyncio.gather(*(run_index(query) for query in indices))
+
+        logger.info("Neo4j indices created")
\ No newline at end of file
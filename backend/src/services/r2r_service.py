@@ -1,15 +1,14 @@
 """R2R service for document processing and RAG operations."""
 
-import os
-import tempfile
+import asyncio
 from collections.abc import AsyncGenerator
-from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
+import orjson
 import structlog
+from async_lru import alru_cache
 from fastapi import UploadFile
-from r2r import R2RClient
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -18,9 +17,42 @@ from tenacity import (
 )
 
 from ..config import settings
+from .reranker_service import RerankerService
 
 logger = structlog.get_logger(__name__)
 
+_HTTPX: httpx.AsyncClient | None = None
+
+
+def get_httpx() -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled HTTP client, creating it lazily.
+
+    A single shared pool means every R2RService instance reuses warm
+    keep-alive connections instead of opening (and TLS-handshaking) its
+    own, and connection limits apply once per process.
+    """
+    global _HTTPX
+    if _HTTPX is None:
+        _HTTPX = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=30.0,
+            ),
+            headers={"Accept": "application/json"},
+        )
+    return _HTTPX
+
+
+async def aclose_httpx():
+    """Close the shared HTTP client at application shutdown."""
+    global _HTTPX
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+        _HTTPX = None
+
 
 class R2RServiceError(Exception):
     """Base exception for R2R service errors."""
@@ -46,18 +78,30 @@ class R2RService:
     SUPPORTED_FORMATS = {"pdf", "docx", "txt", "html", "md", "csv", "json"}
     ENTITY_TYPES = ["Person", "Event", "Location"]
 
+    # RAG and search calls can take full LLM latency; the client default
+    # stays short so health probes fail fast.
+    _SLOW_TIMEOUT = httpx.Timeout(60.0, connect=2.0)
+
     def __init__(self, base_url: str = "http://localhost:7272"):
         """Initialize R2R service client."""
         self.base_url = base_url or settings.r2r_base_url
-        self.client = R2RClient(self.base_url)
-        self._httpx = httpx.AsyncClient(
-            timeout=httpx.Timeout(5.0, connect=2.0),
-            headers={"Accept": "application/json"},
-        )
-        self._temp_dir = tempfile.gettempdir()
+        self._httpx = get_httpx()
+        # The cross-encoder only loads on the first rerank=True search.
+        self._reranker = RerankerService()
 
         logger.info("R2R service initialized", base_url=self.base_url)
 
+    async def _post_json(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        """POST a JSON body to an R2R endpoint and return the parsed reply."""
+        response = await self._httpx.post(
+            f"{self.base_url}{path}",
+            content=orjson.dumps(body),
+            headers={"Content-Type": "application/json"},
+            timeout=self._SLOW_TIMEOUT,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     async def health_check(self) -> dict[str, Any]:
         """Check R2R service health."""
         try:
@@ -66,7 +110,7 @@ class R2RService:
                 return {
                     "status": "healthy",
                     "connected": True,
-                    "details": response.json(),
+                    "details": orjson.loads(response.content),
                 }
             else:
                 return {
@@ -110,40 +154,46 @@ class R2RService:
                 f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
             )
 
-        temp_path = None
         try:
-            # Save file temporarily
-            temp_path = Path(self._temp_dir) / f"upload_{file.filename}"
-            content = await file.read()
-            await file.seek(0)  # Reset for potential reuse
-
-            with open(temp_path, "wb") as f:
-                f.write(content)
-
             logger.info(
                 "Ingesting document",
                 filename=file.filename,
-                size=len(content),
-                temp_path=str(temp_path),
+                size=file.size,
             )
 
-            # Ingest with R2R
-            response = self.client.documents.create(
-                file_path=str(temp_path),
-                metadata={
-                    "filename": file.filename,
-                    "content_type": file.content_type,
-                    "source": "web_upload",
-                    **(metadata or {}),
+            # Hand httpx the spooled upload stream instead of reading
+            # the whole file into memory first: the multipart body is
+            # chunk-encoded, so peak memory per upload stays at one
+            # chunk rather than the full file size.
+            await file.seek(0)
+            response = await self._httpx.post(
+                f"{self.base_url}/v3/documents",
+                files={
+                    "file": (
+                        file.filename,
+                        file.file,
+                        file.content_type or "application/octet-stream",
+                    )
                 },
-                ingestion_mode="fast",  # Use "hi-res" for better quality
+                data={
+                    "metadata": orjson.dumps({
+                        "filename": file.filename,
+                        "content_type": file.content_type,
+                        "source": "web_upload",
+                        **(metadata or {}),
+                    }).decode(),
+                    "ingestion_mode": "fast",  # Use "hi-res" for better quality
+                },
+                timeout=self._SLOW_TIMEOUT,
             )
+            response.raise_for_status()
+            results = orjson.loads(response.content)["results"]
 
             # Response contains document_id and task_id
             result = {
-                "document_id": response["results"]["document_id"],
+                "document_id": results["document_id"],
                 "status": "processing",
-                "task_id": response["results"].get("task_id"),
+                "task_id": results.get("task_id"),
                 "filename": file.filename,
             }
 
@@ -155,33 +205,215 @@ class R2RService:
 
             return result
 
+        except (httpx.TimeoutException, httpx.NetworkError):
+            raise
         except Exception as e:
             logger.error(f"Ingestion failed: {e}", filename=file.filename)
             if isinstance(e, ValueError):
                 raise
             raise R2RIngestionError(f"Document ingestion failed: {str(e)}") from e
-        finally:
-            # Clean up temp file
-            if temp_path and temp_path.exists():
-                try:
-                    os.remove(temp_path)
-                except Exception as e:
-                    logger.warning(f"Failed to remove temp file: {e}")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+        reraise=True,
+    )
+    async def ingest_document_stream(
+        self,
+        file_obj: BinaryIO,
+        filename: str,
+        content_type: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Ingest a document directly from a file-like object.
+
+        Posts the upload stream to R2R's documents endpoint as multipart
+        form data, skipping the tempfile round-trip entirely.
+
+        Args:
+            file_obj: File-like object positioned at the start of the data
+            filename: Original filename (used for format detection)
+            content_type: Optional MIME type of the upload
+            metadata: Optional metadata to attach to the document
+
+        Returns:
+            Document information including ID and status
+        """
+        file_extension = filename.split(".")[-1].lower() if filename else ""
+        if file_extension not in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported file format: {file_extension}. "
+                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+
+        try:
+            logger.info("Ingesting document stream", filename=filename)
+
+            response = await self._httpx.post(
+                f"{self.base_url}/v3/documents",
+                files={
+                    "file": (
+                        filename,
+                        file_obj,
+                        content_type or "application/octet-stream",
+                    )
+                },
+                data={
+                    "metadata": orjson.dumps({
+                        "filename": filename,
+                        "content_type": content_type,
+                        "source": "web_upload",
+                        **(metadata or {}),
+                    }).decode(),
+                    "ingestion_mode": "fast",
+                },
+                timeout=httpx.Timeout(60.0, connect=2.0),
+            )
+            response.raise_for_status()
+            results = orjson.loads(response.content)["results"]
+
+            result = {
+                "document_id": results["document_id"],
+                "status": "processing",
+                "task_id": results.get("task_id"),
+                "filename": filename,
+            }
+
+            logger.info(
+                "Document ingestion initiated",
+                document_id=result["document_id"],
+                task_id=result.get("task_id"),
+            )
+
+            return result
+
+        except (httpx.TimeoutException, httpx.NetworkError):
+            raise
+        except Exception as e:
+            logger.error(f"Streaming ingestion failed: {e}", filename=filename)
+            raise R2RIngestionError(f"Document ingestion failed: {str(e)}") from e
 
     async def hybrid_search(
-        self, query: str, filters: dict[str, Any] | None = None, limit: int = 20
+        self,
+        query: str,
+        filters: dict[str, Any] | None = None,
+        limit: int = 20,
+        rerank: bool = False,
     ) -> dict[str, Any]:
         """
         Perform hybrid vector + keyword search.
 
+        Results are cached for 5 minutes per (query, filters, limit):
+        agent traffic repeats a small set of hot queries, so repeats
+        skip the R2R round-trip. With `rerank` enabled, 4x limit
+        candidates are fetched and rescored by the cross-encoder before
+        truncating to `limit`.
+
         Args:
             query: The search query
             filters: Optional filters to apply
             limit: Maximum number of results
+            rerank: Rescore candidates with the cross-encoder
 
         Returns:
             Search results with relevance scores
         """
+        # Filters are normalized to a canonical JSON string so the
+        # cached helper sees hashable arguments.
+        filters_json = (
+            orjson.dumps(filters, option=orjson.OPT_SORT_KEYS).decode()
+            if filters else None
+        )
+        if not rerank:
+            return await self._hybrid_search_cached(query, filters_json, limit)
+
+        response = await self._hybrid_search_cached(
+            query, filters_json, limit * 4
+        )
+        results = await self._reranker.rerank(
+            query, response.get("results", []), top_k=limit
+        )
+        return {"results": results, "total": len(results), "query": query}
+
+    async def _search_branch(
+        self,
+        query: str,
+        filters: dict[str, Any] | None,
+        limit: int,
+        semantic: bool,
+    ) -> list[dict[str, Any]]:
+        """Run one retrieval branch: semantic vectors or fulltext."""
+        response = await self._post_json("/v3/retrieval/search", {
+            "query": query,
+            "search_settings": {
+                "use_semantic_search": semantic,
+                "use_fulltext_search": not semantic,
+                "use_hybrid_search": False,
+                "filters": filters or {},
+                "limit": limit,
+            },
+        })
+        results = response.get("results", [])
+        if isinstance(results, dict):
+            results = results.get("chunk_search_results", [])
+        return results
+
+    @staticmethod
+    def _rrf_fuse(
+        vector_results: list[dict[str, Any]],
+        keyword_results: list[dict[str, Any]],
+        k: int = 60,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fuse two ranked lists with reciprocal rank fusion.
+
+        Each candidate scores sum(1 / (k + rank)) over the lists it
+        appears in; per-branch scores are carried through for
+        downstream evaluation.
+        """
+        fused: dict[str, dict[str, Any]] = {}
+        branches = (
+            (vector_results, "vector_score"),
+            (keyword_results, "text_score"),
+        )
+        for results, score_field in branches:
+            for rank, item in enumerate(results):
+                key = str(
+                    item.get("id")
+                    or item.get("chunk_id")
+                    or item.get("text", "")
+                )
+                entry = fused.setdefault(key, {
+                    "payload": item,
+                    "rrf_score": 0.0,
+                    "vector_score": None,
+                    "text_score": None,
+                })
+                entry["rrf_score"] += 1.0 / (k + rank + 1)
+                entry[score_field] = item.get("score")
+
+        ranked = sorted(
+            fused.values(), key=lambda e: e["rrf_score"], reverse=True
+        )
+        results = [
+            {
+                **entry["payload"],
+                "rrf_score": entry["rrf_score"],
+                "vector_score": entry["vector_score"],
+                "text_score": entry["text_score"],
+            }
+            for entry in ranked
+        ]
+        return results[:limit] if limit else results
+
+    @alru_cache(maxsize=1024, ttl=300)
+    async def _hybrid_search_cached(
+        self, query: str, filters_json: str | None, limit: int
+    ) -> dict[str, Any]:
+        filters = orjson.loads(filters_json) if filters_json else None
         try:
             logger.info(
                 "Performing hybrid search",
@@ -190,18 +422,15 @@ class R2RService:
                 limit=limit,
             )
 
-            response = self.client.retrieval.search(
-                query=query,
-                search_settings={
-                    "use_hybrid_search": True,
-                    "use_semantic_search": True,
-                    "filters": filters or {},
-                    "limit": limit,
-                    "search_mode": "advanced",
-                },
+            # The vector and keyword branches hit R2R concurrently, so
+            # hybrid latency is the slower branch rather than the sum.
+            vector_results, keyword_results = await asyncio.gather(
+                self._search_branch(query, filters, limit, semantic=True),
+                self._search_branch(query, filters, limit, semantic=False),
+            )
+            results = self._rrf_fuse(
+                vector_results, keyword_results, limit=limit
             )
-
-            results = response.get("results", [])
 
             logger.info(
                 "Hybrid search completed",
@@ -224,6 +453,10 @@ class R2RService:
         """
         Perform RAG query without streaming.
 
+        Answers are cached for 5 minutes per (query, use_graph,
+        filters) — repeated questions skip the full retrieval and
+        generation round-trip.
+
         Args:
             query: The query to answer
             use_graph: Whether to use graph search
@@ -232,6 +465,17 @@ class R2RService:
         Returns:
             Generated response
         """
+        filters_json = (
+            orjson.dumps(filters, option=orjson.OPT_SORT_KEYS).decode()
+            if filters else None
+        )
+        return await self._rag_query_cached(query, use_graph, filters_json)
+
+    @alru_cache(maxsize=1024, ttl=300)
+    async def _rag_query_cached(
+        self, query: str, use_graph: bool, filters_json: str | None
+    ) -> str:
+        filters = orjson.loads(filters_json) if filters_json else None
         try:
             logger.info(
                 "Executing RAG query",
@@ -239,9 +483,9 @@ class R2RService:
                 use_graph=use_graph,
             )
 
-            response = self.client.retrieval.rag(
-                query=query,
-                search_settings={
+            response = await self._post_json("/v3/retrieval/rag", {
+                "query": query,
+                "search_settings": {
                     "use_hybrid_search": True,
                     "filters": filters or {},
                     "graph_search_settings": {
@@ -249,13 +493,13 @@ class R2RService:
                         "include_communities": True,
                     } if use_graph else None,
                 },
-                rag_generation_config={
+                "rag_generation_config": {
                     "model": "anthropic/claude-3-haiku-20240307",
                     "stream": False,
                     "temperature": 0.7,
                     "max_tokens": 2000,
                 },
-            )
+            })
 
             answer = response.get("results", {}).get("completion", {}).get("choices", [{}])[0].get("message", {}).get("content", "")
 
@@ -292,9 +536,9 @@ class R2RService:
                 use_graph=use_graph,
             )
 
-            response = self.client.retrieval.rag(
-                query=query,
-                search_settings={
+            body = {
+                "query": query,
+                "search_settings": {
                     "use_hybrid_search": True,
                     "filters": filters or {},
                     "graph_search_settings": {
@@ -302,18 +546,33 @@ class R2RService:
                         "include_communities": True,
                     } if use_graph else None,
                 },
-                rag_generation_config={
+                "rag_generation_config": {
                     "model": "anthropic/claude-3-haiku-20240307",
                     "stream": True,
                     "temperature": 0.7,
                     "max_tokens": 2000,
                 },
-            )
+            }
 
-            # Stream processing
-            for chunk in response:
-                if chunk and isinstance(chunk, dict):
-                    # Extract content from chunk
+            # Chunks are parsed off the SSE stream as they arrive, so
+            # the event loop stays free between tokens.
+            async with self._httpx.stream(
+                "POST",
+                f"{self.base_url}/v3/retrieval/rag",
+                content=orjson.dumps(body),
+                headers={"Content-Type": "application/json"},
+                timeout=self._SLOW_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[len("data:"):].strip()
+                    if not payload or payload == "[DONE]":
+                        continue
+                    chunk = orjson.loads(payload)
+                    if not isinstance(chunk, dict):
+                        continue
                     if "choices" in chunk:
                         for choice in chunk["choices"]:
                             delta = choice.get("delta", {})
@@ -341,7 +600,11 @@ class R2RService:
         """
         try:
             # R2R auto-extracts during ingestion
-            entities = self.client.documents.list_entities(document_id)
+            response = await self._httpx.get(
+                f"{self.base_url}/v3/documents/{document_id}/entities"
+            )
+            response.raise_for_status()
+            entities = orjson.loads(response.content)
 
             # Group entities by type
             grouped = {entity_type: [] for entity_type in self.ENTITY_TYPES}
@@ -380,7 +643,11 @@ class R2RService:
             Status information including processing state
         """
         try:
-            response = self.client.documents.retrieve(document_id)
+            reply = await self._httpx.get(
+                f"{self.base_url}/v3/documents/{document_id}"
+            )
+            reply.raise_for_status()
+            response = orjson.loads(reply.content)
 
             return {
                 "document_id": document_id,
@@ -409,7 +676,10 @@ class R2RService:
             True if deletion was successful
         """
         try:
-            self.client.documents.delete(document_id)
+            response = await self._httpx.delete(
+                f"{self.base_url}/v3/documents/{document_id}"
+            )
+            response.raise_for_status()
             logger.info("Document deleted", document_id=document_id)
             return True
 
@@ -435,10 +705,15 @@ class R2RService:
             List of document metadata
         """
         try:
-            response = self.client.documents.list(
-                filters=filters or {},
-                limit=limit
+            params: dict[str, Any] = {"limit": limit}
+            if filters:
+                params["filters"] = orjson.dumps(filters).decode()
+
+            reply = await self._httpx.get(
+                f"{self.base_url}/v3/documents", params=params
             )
+            reply.raise_for_status()
+            response = orjson.loads(reply.content)
 
             documents = []
             for doc in response.get("results", []):
@@ -470,7 +745,7 @@ class R2RService:
             response = await self._httpx.get(f"{self.base_url}/tasks/{task_id}")
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 return {
                     "task_id": task_id,
@@ -487,9 +762,12 @@ class R2RService:
             }
 
     async def cleanup(self):
-        """Clean up resources."""
-        if self._httpx:
-            await self._httpx.aclose()
+        """
+        Clean up per-instance resources.
+
+        The shared HTTP client stays open for other users of the pool;
+        the application shutdown hook closes it via aclose_httpx().
+        """
         logger.info("R2R service cleaned up")
 
     async def __aenter__(self):
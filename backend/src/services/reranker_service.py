@@ -0,0 +1,206 @@
+"""Cross-encoder reranking for retrieval results."""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from .semantic_cache import cache_key
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
+
+class _OnnxCrossEncoder:
+    """
+    CrossEncoder-compatible `predict()` backed by an INT8 ONNX session.
+
+    Dynamic weight quantization cuts the model to roughly a quarter of
+    its FP32 size, and on AVX-VNNI hardware onnxruntime runs the INT8
+    matmuls ~4x faster with under a point of accuracy loss — which
+    matters because the reranker sits on the search hot path.
+    """
+
+    def __init__(self, save_dir: Path):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        self._tokenizer = AutoTokenizer.from_pretrained(save_dir)
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = os.cpu_count() or 1
+        self._session = onnxruntime.InferenceSession(
+            str(next(save_dir.glob("*quantized*.onnx"))),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+    def predict(self, pairs: List[List[str]], batch_size: int = 32):
+        scores: List[float] = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            encoded = self._tokenizer(
+                [query for query, _ in batch],
+                [text for _, text in batch],
+                padding=True,
+                truncation=True,
+                max_length=512,
+                return_tensors="np"
+            )
+            feeds = {
+                name: array for name, array in encoded.items()
+                if name in self._input_names
+            }
+            logits = self._session.run(None, feeds)[0]
+            scores.extend(float(row[0]) for row in logits)
+        return scores
+
+
+def _export_int8(model_name: str, save_dir: Path):
+    """Export the model to ONNX and INT8-quantize it into save_dir."""
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        model_name, export=True
+    )
+    model.save_pretrained(save_dir)
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantizer.quantize(
+        save_dir=save_dir,
+        quantization_config=AutoQuantizationConfig.avx_vnni(is_static=False)
+    )
+
+
+def _is_literal_lookup(query: str) -> bool:
+    """
+    True for queries where first-stage lexical scoring already decides
+    the ranking — quoted phrases and filename-style tokens. Reranking
+    these wastes model time without changing the order.
+    """
+    stripped = query.strip()
+    if stripped.startswith('"') and stripped.endswith('"'):
+        return True
+    return "." in stripped and " " not in stripped
+
+
+class RerankerService:
+    """
+    Rescores top-k retrieval candidates with a cross-encoder.
+
+    The first-stage retriever optimizes recall; the cross-encoder reads
+    query and candidate together and produces a much sharper relevance
+    ordering for the handful of rows that survive. The model is loaded
+    lazily on first use — as an INT8 ONNX session when optimum and
+    onnxruntime are installed, otherwise the FP32 sentence-transformers
+    path — and inference runs in a worker thread so the event loop stays
+    free. Pair scores are cached with a TTL since hot queries
+    re-encounter the same candidates.
+    """
+
+    def __init__(
+        self,
+        model_name: str = _DEFAULT_MODEL,
+        batch_size: int = 32,
+        score_ttl_seconds: float = 900.0,
+        max_cached_scores: int = 16384
+    ):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.score_ttl = score_ttl_seconds
+        self.max_cached_scores = max_cached_scores
+        self._model = None
+        self._scores: Dict[str, tuple] = {}
+
+    def _load_model(self):
+        if self._model is None:
+            try:
+                self._model = self._load_onnx_int8()
+                logger.info(
+                    "INT8 ONNX cross-encoder loaded", model=self.model_name
+                )
+            except ImportError:
+                # optimum/onnxruntime not installed; fall back to the
+                # FP32 sentence-transformers path.
+                from sentence_transformers import CrossEncoder
+
+                self._model = CrossEncoder(self.model_name)
+                logger.info("Cross-encoder loaded", model=self.model_name)
+        return self._model
+
+    def _load_onnx_int8(self) -> _OnnxCrossEncoder:
+        save_dir = (
+            Path.home() / ".cache" / "graphaura" / "reranker-int8"
+            / self.model_name.replace("/", "--")
+        )
+        # Export and quantization run once; later startups reuse the
+        # cached artifacts.
+        if not any(save_dir.glob("*quantized*.onnx")):
+            save_dir.mkdir(parents=True, exist_ok=True)
+            _export_int8(self.model_name, save_dir)
+        return _OnnxCrossEncoder(save_dir)
+
+    def _predict(self, pairs: List[List[str]]):
+        return self._load_model().predict(pairs, batch_size=self.batch_size)
+
+    def _cached_score(self, key: str) -> Optional[float]:
+        entry = self._scores.get(key)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def _store_score(self, key: str, score: float):
+        if len(self._scores) >= self.max_cached_scores:
+            self._scores.clear()
+        self._scores[key] = (score, time.monotonic() + self.score_ttl)
+
+    async def rerank(
+        self,
+        query: str,
+        candidates: List[Dict[str, Any]],
+        text_key: str = "text",
+        top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Reorder candidates by cross-encoder relevance to the query.
+
+        Args:
+            query: The search query
+            candidates: First-stage results to rescore
+            text_key: Candidate field holding the passage text
+            top_k: Truncate the reranked list to this many results
+
+        Returns:
+            Candidates sorted by rerank score, each with a
+            `rerank_score` field
+        """
+        if not candidates or _is_literal_lookup(query):
+            return candidates[:top_k] if top_k else candidates
+
+        texts = [str(c.get(text_key, "")) for c in candidates]
+        keys = [cache_key(query, text) for text in texts]
+        scores: List[Optional[float]] = [self._cached_score(k) for k in keys]
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            pairs = [[query, texts[i]] for i in missing]
+            # Model load (including the one-time ONNX export) happens in
+            # the worker thread too, so first use never stalls the loop.
+            fresh = await asyncio.to_thread(self._predict, pairs)
+            for i, score in zip(missing, fresh):
+                scores[i] = float(score)
+                self._store_score(keys[i], float(score))
+
+        ranked = sorted(
+            (
+                {**candidate, "rerank_score": score}
+                for candidate, score in zip(candidates, scores)
+            ),
+            key=lambda c: c["rerank_score"],
+            reverse=True
+        )
+        return ranked[:top_k] if top_k else ranked
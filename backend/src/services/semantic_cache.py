@@ -0,0 +1,179 @@
+"""In-process semantic cache for search responses."""
+
+from typing import Optional, Dict, Any, List
+import asyncio
+import hashlib
+import time
+
+import numpy as np
+import orjson
+import structlog
+
+from ..config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def cache_key(query: str, params: Any = None) -> str:
+    """
+    Deterministic compact key for a (query, params) cache lookup.
+
+    orjson serializes in C and blake2b digests at memory speed, so key
+    construction stays sub-microsecond, and the fixed 16-byte digest
+    keeps cache entries from carrying arbitrarily long concatenated
+    keys. Sorted keys make dict param order irrelevant.
+    """
+    return hashlib.blake2b(
+        query.encode() + orjson.dumps(params, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+
+
+class SemanticCache:
+    """
+    Small in-memory cache for search and RAG responses.
+
+    Embedding-keyed entries are matched by cosine similarity against a
+    dense matrix (brute-force inner product over normalized vectors), so
+    near-duplicate queries hit without being byte-identical. Text-keyed
+    entries are matched exactly after whitespace/case normalization.
+    Entries expire after a TTL and the least recently used entry is
+    evicted when the cache is full.
+    """
+
+    def __init__(
+        self,
+        dimension: Optional[int] = None,
+        max_entries: int = 512,
+        ttl_seconds: float = 300.0,
+        similarity_threshold: float = 0.95
+    ):
+        self.dimension = dimension or settings.vector_dimension
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._embeddings = np.empty((0, self.dimension), dtype=np.float32)
+        self._embedding_entries: List[Dict[str, Any]] = []
+        self._text_entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return " ".join(text.casefold().split())
+
+    @staticmethod
+    def _normalize_vector(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        return time.monotonic() > entry["expiry"]
+
+    async def get_by_embedding(
+        self,
+        embedding: List[float]
+    ) -> Optional[Any]:
+        """Return the cached payload for the most similar unexpired entry."""
+        if not self._embedding_entries or len(embedding) != self.dimension:
+            self.misses += 1
+            return None
+
+        query = self._normalize_vector(embedding)
+        scores = self._embeddings @ query
+        best = int(np.argmax(scores))
+
+        entry = self._embedding_entries[best]
+        if scores[best] >= self.similarity_threshold and not self._expired(entry):
+            entry["last_access"] = time.monotonic()
+            self.hits += 1
+            return entry["payload"]
+
+        self.misses += 1
+        return None
+
+    async def set_by_embedding(self, embedding: List[float], payload: Any):
+        """Cache a payload keyed by its query embedding."""
+        if len(embedding) != self.dimension:
+            return
+
+        async with self._lock:
+            await self._evict_if_full()
+            self._embeddings = np.vstack([
+                self._embeddings,
+                self._normalize_vector(embedding)[np.newaxis, :]
+            ])
+            self._embedding_entries.append({
+                "payload": payload,
+                "expiry": time.monotonic() + self.ttl_seconds,
+                "last_access": time.monotonic()
+            })
+
+    async def get_by_text(self, text: str) -> Optional[Any]:
+        """Return the cached payload for a normalized text key."""
+        entry = self._text_entries.get(self._normalize_text(text))
+
+        if entry and not self._expired(entry):
+            entry["last_access"] = time.monotonic()
+            self.hits += 1
+            return entry["payload"]
+
+        self.misses += 1
+        return None
+
+    async def set_by_text(self, text: str, payload: Any):
+        """Cache a payload keyed by normalized text."""
+        async with self._lock:
+            await self._evict_if_full()
+            self._text_entries[self._normalize_text(text)] = {
+                "payload": payload,
+                "expiry": time.monotonic() + self.ttl_seconds,
+                "last_access": time.monotonic()
+            }
+
+    async def _evict_if_full(self):
+        """Drop the least recently used entry once the cache is full."""
+        total = len(self._embedding_entries) + len(self._text_entries)
+        if total < self.max_entries:
+            return
+
+        oldest_text = min(
+            self._text_entries,
+            key=lambda k: self._text_entries[k]["last_access"],
+            default=None
+        )
+        oldest_embedding = min(
+            range(len(self._embedding_entries)),
+            key=lambda i: self._embedding_entries[i]["last_access"],
+            default=None
+        )
+
+        text_age = (
+            self._text_entries[oldest_text]["last_access"]
+            if oldest_text is not None else float("inf")
+        )
+        embedding_age = (
+            self._embedding_entries[oldest_embedding]["last_access"]
+            if oldest_embedding is not None else float("inf")
+        )
+
+        if text_age <= embedding_age:
+            del self._text_entries[oldest_text]
+        else:
+            self._embeddings = np.delete(
+                self._embeddings, oldest_embedding, axis=0
+            )
+            del self._embedding_entries[oldest_embedding]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current entry counts."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "embedding_entries": len(self._embedding_entries),
+            "text_entries": len(self._text_entries)
+        }
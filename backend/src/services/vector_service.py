@@ -1,8 +1,16 @@
 """Vector search and similarity service for GraphAura."""
 
+import asyncio
+import random
+import struct
+
 import numpy as np
+import orjson
+from async_lru import alru_cache
+import scipy.sparse as sp
+from scipy.linalg.blas import ssyrk
+from scipy.sparse.csgraph import connected_components
 from typing import List, Dict, Any, Optional, Tuple
-from sklearn.metrics.pairwise import cosine_similarity
 import structlog
 import asyncpg
 
@@ -11,6 +19,37 @@ from ..models.entities import Entity
 
 logger = structlog.get_logger(__name__)
 
+# Fraction of similarity queries whose plan is sampled with EXPLAIN.
+_PLAN_SAMPLE_RATE = 0.001
+
+
+# pgvector binary wire format: uint16 dimension, uint16 unused flags,
+# then big-endian float32s. Registering a binary codec means embeddings
+# cross the wire as packed floats instead of "[0.1,0.2,...]" text —
+# no per-element str() on the way out and no text parse on the server.
+
+def _encode_vector(value) -> bytes:
+    vec = np.ascontiguousarray(value, dtype=">f4")
+    return struct.pack(">HH", vec.shape[0], 0) + vec.tobytes()
+
+
+def _decode_vector(value: bytes) -> np.ndarray:
+    dim, _ = struct.unpack_from(">HH", value)
+    return np.frombuffer(
+        value, dtype=">f4", offset=4, count=dim
+    ).astype(np.float32)
+
+
+def _l2_normalize(embedding) -> np.ndarray:
+    """
+    Normalize to unit length. Stored and query vectors being unit-norm
+    makes cosine similarity equal to the plain inner product, so
+    searches can use pgvector's cheaper <#> operator.
+    """
+    vec = np.ascontiguousarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else vec
+
 
 class VectorService:
     """Service for vector operations and similarity search."""
@@ -24,21 +63,40 @@ class VectorService:
     async def connect(self):
         """Connect to PostgreSQL with pgvector."""
         try:
+            # The vector type must exist before the pool's init callback
+            # can bind a codec to it, so the extension is created on a
+            # throwaway connection before any pool connection opens.
+            setup_conn = await asyncpg.connect(
+                host=settings.postgres_host,
+                port=settings.postgres_port,
+                user=settings.postgres_user,
+                password=settings.postgres_password,
+                database=settings.postgres_db
+            )
+            try:
+                await setup_conn.execute(
+                    "CREATE EXTENSION IF NOT EXISTS vector"
+                )
+            finally:
+                await setup_conn.close()
+
             self.pool = await asyncpg.create_pool(
                 host=settings.postgres_host,
                 port=settings.postgres_port,
                 user=settings.postgres_user,
                 password=settings.postgres_password,
                 database=settings.postgres_db,
-                min_size=10,
-                max_size=20,
+                min_size=settings.postgres_pool_min,
+                max_size=settings.postgres_pool_max,
                 command_timeout=60,
-                statement_cache_size=0  # Required for PgBouncer/Supabase pooler
+                statement_cache_size=(
+                    0 if settings.pgbouncer_mode
+                    else settings.postgres_statement_cache_size
+                ),
+                init=self._init_connection
             )
 
-            # Create pgvector extension if not exists
             async with self.pool.acquire() as conn:
-                await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
                 await self._create_tables(conn)
 
             logger.info("Connected to PostgreSQL with pgvector")
@@ -61,6 +119,35 @@ class VectorService:
         """Async context manager exit."""
         await self.disconnect()
 
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection):
+        """Register the binary vector codec on a new pool connection."""
+        await conn.set_type_codec(
+            "vector",
+            encoder=_encode_vector,
+            decoder=_decode_vector,
+            schema="public",
+            format="binary"
+        )
+        # orjson on both sides of jsonb: faster than asyncpg's stdlib
+        # default and lets callers pass dicts as jsonb params directly.
+        await conn.set_type_codec(
+            "jsonb",
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+            format="text"
+        )
+        # Session-level ef_search covers every query on this connection,
+        # saving the SET LOCAL round-trip per search.
+        await conn.execute(
+            f"SET hnsw.ef_search = {int(settings.hnsw_ef_search)}"
+        )
+        # Bound worst-case blocking: a runaway plan or a lock pile-up
+        # fails the one query instead of wedging the pool.
+        await conn.execute("SET statement_timeout = '5s'")
+        await conn.execute("SET lock_timeout = '1s'")
+
     async def _create_tables(self, conn: asyncpg.Connection):
         """Create necessary tables for vector storage."""
         # Use string formatting for CREATE TABLE since parameters aren't supported
@@ -70,17 +157,69 @@ class VectorService:
                 entity_id TEXT NOT NULL UNIQUE,
                 entity_type TEXT NOT NULL,
                 embedding vector({self.dimension}) NOT NULL,
+                embedding_bin bit({self.dimension}) GENERATED ALWAYS AS
+                    (binary_quantize(embedding)::bit({self.dimension})) STORED,
                 metadata JSONB DEFAULT '{{}}',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
 
-        # Create index for vector similarity search
+        # Existing deployments predate the generated column.
+        await conn.execute(f"""
+            ALTER TABLE entity_embeddings
+            ADD COLUMN IF NOT EXISTS embedding_bin bit({self.dimension})
+                GENERATED ALWAYS AS
+                (binary_quantize(embedding)::bit({self.dimension})) STORED
+        """)
+
+        # Bookkeeping for one-shot data migrations.
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS vector_migrations (
+                name TEXT PRIMARY KEY,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Rows written before the inner-product switch are not unit-norm,
+        # which skews <#> ordering and the threshold filter; rewrite them
+        # once. l2_normalize needs pgvector >= 0.7. The migration runs in
+        # its own transaction with the session statement timeout lifted,
+        # since rewriting every row can exceed the 5s query budget.
+        normalized = await conn.fetchval(
+            "SELECT 1 FROM vector_migrations WHERE name = 'normalize_embeddings'"
+        )
+        if not normalized:
+            async with conn.transaction():
+                await conn.execute("SET LOCAL statement_timeout = 0")
+                await conn.execute(
+                    "UPDATE entity_embeddings "
+                    "SET embedding = l2_normalize(embedding)"
+                )
+                await conn.execute(
+                    "INSERT INTO vector_migrations (name) "
+                    "VALUES ('normalize_embeddings') "
+                    "ON CONFLICT (name) DO NOTHING"
+                )
+            logger.info("Normalized pre-existing embeddings in place")
+
+        # Create index for vector similarity search. HNSW gives better
+        # recall/latency than IVFFlat and needs no training step.
+        # Vectors are stored unit-normalized, so inner-product ordering
+        # matches cosine without the per-comparison norm arithmetic.
+        # Drop the superseded indexes: the baseline IVFFlat index and the
+        # interim cosine HNSW index both add write amplification and can
+        # still be picked by the planner over the inner-product index.
+        await conn.execute("""
+            DROP INDEX IF EXISTS idx_entity_embeddings_vector
+        """)
         await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_entity_embeddings_vector
-            ON entity_embeddings USING ivfflat (embedding vector_cosine_ops)
-            WITH (lists = 100)
+            DROP INDEX IF EXISTS idx_entity_embeddings_hnsw
+        """)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entity_embeddings_hnsw_ip
+            ON entity_embeddings USING hnsw (embedding vector_ip_ops)
+            WITH (m = 16, ef_construction = 64)
         """)
 
         # Create index for entity lookups
@@ -89,6 +228,20 @@ class VectorService:
             ON entity_embeddings(entity_id)
         """)
 
+        # Hamming-distance index over the binary-quantized column: the
+        # first-pass shortlist scans 1 bit per dimension instead of 32.
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entity_embeddings_bin_hnsw
+            ON entity_embeddings USING hnsw (embedding_bin bit_hamming_ops)
+        """)
+
+        # similarity_search filters on entity_type = ANY($3); without
+        # this the type filter runs row-by-row after the ANN probe.
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entity_embeddings_entity_type
+            ON entity_embeddings(entity_type)
+        """)
+
     async def store_embedding(
         self,
         entity_id: str,
@@ -114,27 +267,93 @@ class VectorService:
                 f"got {len(embedding)}"
             )
 
-        async with self.pool.acquire() as conn:
-            # Convert list to pgvector format
-            embedding_str = f"[{','.join(map(str, embedding))}]"
+        embedding = _l2_normalize(embedding)
 
+        async with self.pool.acquire() as conn:
             result = await conn.fetchrow("""
                 INSERT INTO entity_embeddings (entity_id, entity_type, embedding, metadata)
-                VALUES ($1, $2, $3::vector, $4)
+                VALUES ($1, $2, $3, $4)
                 ON CONFLICT (entity_id)
                 DO UPDATE SET
                     embedding = EXCLUDED.embedding,
                     metadata = EXCLUDED.metadata,
                     updated_at = CURRENT_TIMESTAMP
                 RETURNING id
-            """, entity_id, entity_type, embedding_str, metadata or {})
+            """, entity_id, entity_type, embedding, metadata or {})
 
+            self.get_embedding.cache_invalidate(entity_id)
             logger.info("Embedding stored", entity_id=entity_id)
             return str(result["id"])
 
+    async def store_embeddings_batch(
+        self,
+        items: List[Tuple[str, str, List[float], Optional[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Store multiple entity embeddings with a single upsert.
+
+        Rows stream into a temp staging table over the binary COPY
+        protocol — one round-trip and one WAL flush for the whole batch
+        instead of one per row — then a single INSERT ... SELECT merges
+        them with conflict handling.
+
+        Args:
+            items: Tuples of (entity_id, entity_type, embedding, metadata)
+
+        Returns:
+            Number of embeddings written
+        """
+        if not items:
+            return 0
+
+        rows = []
+        for entity_id, entity_type, embedding, metadata in items:
+            if len(embedding) != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension mismatch: expected {self.dimension}, "
+                    f"got {len(embedding)}"
+                )
+            rows.append((
+                entity_id, entity_type, _l2_normalize(embedding),
+                metadata or {}
+            ))
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("""
+                    CREATE TEMP TABLE staging_emb
+                    (LIKE entity_embeddings INCLUDING DEFAULTS)
+                    ON COMMIT DROP
+                """)
+                await conn.copy_records_to_table(
+                    "staging_emb",
+                    records=rows,
+                    columns=["entity_id", "entity_type", "embedding", "metadata"]
+                )
+                await conn.execute("""
+                    INSERT INTO entity_embeddings (entity_id, entity_type, embedding, metadata)
+                    SELECT entity_id, entity_type, embedding, metadata
+                    FROM staging_emb
+                    ON CONFLICT (entity_id)
+                    DO UPDATE SET
+                        embedding = EXCLUDED.embedding,
+                        metadata = EXCLUDED.metadata,
+                        updated_at = CURRENT_TIMESTAMP
+                """)
+
+        for entity_id, _, _, _ in rows:
+            self.get_embedding.cache_invalidate(entity_id)
+        logger.info("Embedding batch stored", count=len(rows))
+        return len(rows)
+
+    @alru_cache(maxsize=4096, ttl=300)
     async def get_embedding(self, entity_id: str) -> Optional[np.ndarray]:
         """
-        Get embedding for an entity.
+        Get embedding for an entity, cached for 5 minutes per ID.
+
+        Query traffic is heavily skewed toward a small set of hot
+        entities, so repeats skip the round-trip; writes invalidate the
+        entry.
 
         Args:
             entity_id: Entity ID
@@ -144,15 +363,39 @@ class VectorService:
         """
         async with self.pool.acquire() as conn:
             result = await conn.fetchrow("""
-                SELECT embedding::float[] as embedding
+                SELECT embedding
                 FROM entity_embeddings
                 WHERE entity_id = $1
             """, entity_id)
 
             if result:
-                return np.array(result["embedding"])
+                return result["embedding"]
             return None
 
+    @staticmethod
+    async def _maybe_sample_plan(conn: asyncpg.Connection, sql: str, *args):
+        """
+        EXPLAIN a sampled fraction of similarity queries.
+
+        The index-friendly query shape silently degrades to a
+        sequential scan if a future edit wraps the distance operator
+        again; this canary surfaces that from production traffic
+        instead of a latency graph.
+        """
+        if random.random() >= _PLAN_SAMPLE_RATE:
+            return
+        try:
+            plan = await conn.fetchval(
+                "EXPLAIN (FORMAT JSON, ANALYZE, BUFFERS) " + sql, *args
+            )
+            if "Seq Scan" in str(plan):
+                logger.warning(
+                    "Sequential scan in vector similarity query",
+                    plan=str(plan)[:2000]
+                )
+        except Exception as e:
+            logger.debug("Plan sampling failed", error=str(e))
+
     async def similarity_search(
         self,
         query_embedding: List[float],
@@ -179,31 +422,42 @@ class VectorService:
             )
 
         threshold = threshold or self.similarity_threshold
-        embedding_str = f"[{','.join(map(str, query_embedding))}]"
 
         async with self.pool.acquire() as conn:
-            # Build query with optional entity type filter
-            where_clause = ""
-            params = [embedding_str, limit]
-
-            if entity_types:
-                where_clause = f"AND entity_type = ANY($3)"
-                params.append(entity_types)
-
-            query = f"""
-                SELECT
-                    entity_id,
-                    entity_type,
-                    metadata,
-                    1 - (embedding <=> $1::vector) as similarity
-                FROM entity_embeddings
-                WHERE 1 - (embedding <=> $1::vector) >= {threshold}
-                    {where_clause}
-                ORDER BY embedding <=> $1::vector
-                LIMIT $2
+            # Two-stage ANN: a Hamming scan over the binary-quantized
+            # column shortlists candidates at 1 bit per dimension, then
+            # exact inner product (cosine, since vectors are stored
+            # unit-norm) reranks the shortlist. ORDER BY stays the bare
+            # distance operator at each stage so the HNSW indexes drive
+            # both scans; the threshold filters the reranked top-k in
+            # the outermost select (<#> returns the negated dot, so
+            # sim >= t becomes dist <= -t).
+            shortlist = max(200, limit * 8)
+            sql = f"""
+                SELECT entity_id, entity_type, metadata,
+                       -dist AS similarity
+                FROM (
+                    SELECT entity_id, entity_type, metadata,
+                           embedding <#> $1 AS dist
+                    FROM (
+                        SELECT entity_id, entity_type, metadata, embedding
+                        FROM entity_embeddings
+                        WHERE $3::text[] IS NULL OR entity_type = ANY($3)
+                        ORDER BY embedding_bin <~>
+                            binary_quantize($1)::bit({self.dimension})
+                        LIMIT $5
+                    ) shortlist
+                    ORDER BY embedding <#> $1
+                    LIMIT $4
+                ) reranked
+                WHERE dist <= $2
             """
-
-            results = await conn.fetch(query, *params)
+            params = (
+                _l2_normalize(query_embedding), -threshold, entity_types,
+                limit, shortlist
+            )
+            results = await conn.fetch(sql, *params)
+            await self._maybe_sample_plan(conn, sql, *params)
 
             return [
                 {
@@ -215,6 +469,81 @@ class VectorService:
                 for row in results
             ]
 
+    async def similarity_search_batch(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 10,
+        entity_types: Optional[List[str]] = None,
+        threshold: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run similarity search for several query embeddings in one query.
+
+        Uses UNNEST + LATERAL so all lookups share a single round-trip
+        and plan. Results preserve the input order.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            limit: Maximum results per query
+            entity_types: Filter by entity types
+            threshold: Similarity threshold (default from config)
+
+        Returns:
+            One result list per query embedding, in input order
+        """
+        if not query_embeddings:
+            return []
+
+        for query_embedding in query_embeddings:
+            if len(query_embedding) != self.dimension:
+                raise ValueError(
+                    f"Embedding dimension mismatch: expected {self.dimension}, "
+                    f"got {len(query_embedding)}"
+                )
+
+        threshold = threshold or self.similarity_threshold
+
+        async with self.pool.acquire() as conn:
+            # Same HNSW-friendly shape as similarity_search: each
+            # lateral orders on the bare distance operator, and the
+            # threshold filters the per-query top-k afterwards.
+            results = await conn.fetch("""
+                SELECT
+                    q.ord,
+                    e.entity_id,
+                    e.entity_type,
+                    e.metadata,
+                    -e.dist AS similarity
+                FROM UNNEST($1::vector[]) WITH ORDINALITY AS q(embedding, ord)
+                CROSS JOIN LATERAL (
+                    SELECT
+                        entity_id,
+                        entity_type,
+                        metadata,
+                        embedding <#> q.embedding AS dist
+                    FROM entity_embeddings
+                    WHERE $3::text[] IS NULL OR entity_type = ANY($3)
+                    ORDER BY embedding <#> q.embedding
+                    LIMIT $4
+                ) e
+                WHERE e.dist <= $2
+                ORDER BY q.ord, e.dist
+            """, [_l2_normalize(q) for q in query_embeddings],
+                -threshold, entity_types, limit)
+
+            batched: List[List[Dict[str, Any]]] = [
+                [] for _ in query_embeddings
+            ]
+            for row in results:
+                batched[row["ord"] - 1].append({
+                    "entity_id": row["entity_id"],
+                    "entity_type": row["entity_type"],
+                    "metadata": dict(row["metadata"]),
+                    "similarity": float(row["similarity"])
+                })
+
+            return batched
+
     async def batch_similarity(
         self,
         entity_ids: List[str]
@@ -230,7 +559,7 @@ class VectorService:
         """
         async with self.pool.acquire() as conn:
             results = await conn.fetch("""
-                SELECT entity_id, embedding::float[] as embedding
+                SELECT entity_id, embedding
                 FROM entity_embeddings
                 WHERE entity_id = ANY($1)
                 ORDER BY array_position($1::text[], entity_id)
@@ -239,61 +568,98 @@ class VectorService:
             if not results:
                 return np.array([])
 
-            embeddings = np.array([row["embedding"] for row in results])
-            return cosine_similarity(embeddings)
+            # The binary codec already yields float32 arrays; pack them
+            # into one contiguous (N, dim) matrix and normalize in
+            # place. The Gram matrix is symmetric, so BLAS syrk computes
+            # only one triangle — half the FLOPs of a full matmul — and
+            # the untouched triangle (allocated zeroed) is mirrored in.
+            matrix = np.empty((len(results), self.dimension), dtype=np.float32)
+            for i, row in enumerate(results):
+                matrix[i] = row["embedding"]
+
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            matrix /= norms
+
+            gram = ssyrk(1.0, matrix)
+            return gram + gram.T - np.diag(np.diag(gram))
 
     async def find_clusters(
         self,
         min_similarity: float = 0.8,
-        min_cluster_size: int = 2
+        min_cluster_size: int = 2,
+        neighbors_per_node: int = 20
     ) -> List[List[str]]:
         """
         Find clusters of similar entities.
 
+        The neighbor search runs inside Postgres: a lateral self-join
+        probes the HNSW index for each row's nearest neighbors above the
+        similarity threshold, so only the (src, dst) edge list crosses
+        the wire instead of every embedding. Clusters are the connected
+        components of that edge graph.
+
         Args:
             min_similarity: Minimum similarity for clustering
             min_cluster_size: Minimum cluster size
+            neighbors_per_node: Nearest neighbors considered per entity
 
         Returns:
             List of entity clusters
         """
         async with self.pool.acquire() as conn:
-            # Get all embeddings
-            results = await conn.fetch("""
-                SELECT entity_id, embedding::float[] as embedding
-                FROM entity_embeddings
-            """)
-
-            if len(results) < min_cluster_size:
-                return []
-
-            entity_ids = [row["entity_id"] for row in results]
-            embeddings = np.array([row["embedding"] for row in results])
-
-            # Compute similarity matrix
-            similarity_matrix = cosine_similarity(embeddings)
-
-            # Simple clustering based on similarity threshold
-            clusters = []
-            visited = set()
-
-            for i, entity_id in enumerate(entity_ids):
-                if entity_id in visited:
-                    continue
-
-                cluster = [entity_id]
-                visited.add(entity_id)
-
-                for j, other_id in enumerate(entity_ids):
-                    if i != j and other_id not in visited:
-                        if similarity_matrix[i][j] >= min_similarity:
-                            cluster.append(other_id)
-                            visited.add(other_id)
-
-                if len(cluster) >= min_cluster_size:
-                    clusters.append(cluster)
-
-            return clusters
+            edges = await conn.fetch("""
+                SELECT src, dst FROM (
+                    SELECT a.entity_id AS src,
+                           n.entity_id AS dst,
+                           n.dist
+                    FROM entity_embeddings a
+                    CROSS JOIN LATERAL (
+                        SELECT b.entity_id,
+                               b.embedding <#> a.embedding AS dist
+                        FROM entity_embeddings b
+                        WHERE b.entity_id <> a.entity_id
+                        ORDER BY b.embedding <#> a.embedding
+                        LIMIT $2
+                    ) n
+                ) t
+                WHERE dist <= $1
+            """, -min_similarity, neighbors_per_node)
+
+        if not edges:
+            return []
+
+        # Union-find over the similarity edges: connected components of
+        # the sparse pair graph are the clusters. Entities with no
+        # above-threshold neighbor are singletons and can't reach
+        # min_cluster_size (>= 2), so they never need to leave Postgres.
+        index_of: Dict[str, int] = {}
+        for row in edges:
+            for entity_id in (row["src"], row["dst"]):
+                if entity_id not in index_of:
+                    index_of[entity_id] = len(index_of)
+
+        entity_ids = list(index_of)
+        n = len(entity_ids)
+        sources = np.fromiter(
+            (index_of[row["src"]] for row in edges), dtype=np.int64
+        )
+        targets = np.fromiter(
+            (index_of[row["dst"]] for row in edges), dtype=np.int64
+        )
+        graph = sp.coo_matrix(
+            (np.ones(len(edges)), (sources, targets)), shape=(n, n)
+        )
+        _, labels = connected_components(graph, directed=False)
+
+        grouped: Dict[int, List[str]] = {}
+        for index, label in enumerate(labels):
+            grouped.setdefault(label, []).append(entity_ids[index])
+
+        return [
+            cluster for cluster in grouped.values()
+            if len(cluster) >= min_cluster_size
+        ]
 
     async def update_embedding(
         self,
@@ -316,17 +682,18 @@ class VectorService:
                 f"got {len(embedding)}"
             )
 
-        async with self.pool.acquire() as conn:
-            embedding_str = f"[{','.join(map(str, embedding))}]"
+        embedding = _l2_normalize(embedding)
 
+        async with self.pool.acquire() as conn:
             result = await conn.fetchval("""
                 UPDATE entity_embeddings
-                SET embedding = $2::vector, updated_at = CURRENT_TIMESTAMP
+                SET embedding = $2, updated_at = CURRENT_TIMESTAMP
                 WHERE entity_id = $1
                 RETURNING id
-            """, entity_id, embedding_str)
+            """, entity_id, embedding)
 
             if result:
+                self.get_embedding.cache_invalidate(entity_id)
                 logger.info("Embedding updated", entity_id=entity_id)
                 return True
             return False
@@ -349,6 +716,7 @@ class VectorService:
             """, entity_id)
 
             if result:
+                self.get_embedding.cache_invalidate(entity_id)
                 logger.info("Embedding deleted", entity_id=entity_id)
                 return True
             return False
@@ -384,4 +752,101 @@ class VectorService:
                     row["entity_type"]: row["count"]
                     for row in type_counts
                 }
-            }
\ No newline at end of file
+            }
+
+
+class EmbeddingCoalescer:
+    """Buffers embedding writes and flushes them in batches.
+
+    Submitted items are queued and written with a single
+    store_embeddings_batch call once batch_size items are pending or
+    flush_interval_ms has elapsed, whichever comes first. Embedding
+    writes become eventually consistent; the graph write stays the
+    synchronous source of truth.
+    """
+
+    def __init__(
+        self,
+        vector_service: VectorService,
+        batch_size: int = 64,
+        flush_interval_ms: int = 20
+    ):
+        """Initialize the coalescer around a connected vector service."""
+        self.vector_service = vector_service
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop and drain any pending items."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def submit(
+        self,
+        item: Tuple[str, str, List[float], Optional[Dict[str, Any]]]
+    ):
+        """Queue one (entity_id, entity_type, embedding, metadata) tuple.
+
+        Dimensions are checked here so a bad submission fails its own
+        request instead of poisoning the coalesced batch at flush time,
+        where the error would silently drop every other caller's write.
+        """
+        expected = self.vector_service.dimension
+        if len(item[2]) != expected:
+            raise ValueError(
+                f"Embedding dimension mismatch: got {len(item[2])}, "
+                f"expected {expected}"
+            )
+        await self.queue.put(item)
+
+    async def flush(self):
+        """Write out everything currently queued."""
+        items = []
+        while not self.queue.empty():
+            items.append(self.queue.get_nowait())
+
+        if items:
+            await self.vector_service.store_embeddings_batch(items)
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(await asyncio.wait_for(
+                        self.queue.get(),
+                        timeout=self.flush_interval
+                    ))
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # Items already popped into the batch are invisible to
+                # stop()'s queue flush; write them out before exiting.
+                await self._store(batch)
+                raise
+
+            await self._store(batch)
+
+    async def _store(self, batch):
+        try:
+            await self.vector_service.store_embeddings_batch(batch)
+        except Exception as e:
+            logger.error(
+                "Embedding batch flush failed",
+                error=str(e),
+                batch_size=len(batch)
+            )
\ No newline at end of file
@@ -59,7 +59,9 @@ export const graphApi = {
   async getGraph(): Promise<GraphData> {
     try {
       // Fetch all nodes and relationships from Neo4j
-      const response = await api.post('/graph/cypher?query=' + encodeURIComponent('MATCH (n) OPTIONAL MATCH (n)-[r]-(m) RETURN DISTINCT n, r, m LIMIT 500'), {});
+      const response = await api.post('/graph/cypher', {
+        query: 'MATCH (n) OPTIONAL MATCH (n)-[r]-(m) RETURN DISTINCT n, r, m LIMIT 500',
+      });
 
       const nodes = new Map<string, GraphNode>();
       const links: GraphLink[] = [];